@@ -1,15 +1,10 @@
-import math
-import random
 import statistics
-import simpy
+import numpy as np
 
-# Import the functions from the main simulation
+# Import the arrival model (simpy-free) shared with the hourly tables
 import sys
 sys.path.append('.')
-from ct_scan_shands_des import (
-    generate_patient_arrivals, NUM_SCANNERS, NUM_ROBOTS, 
-    DAY_LENGTH_MIN, simulate_one_day
-)
+from ct_scan_arrivals import generate_patient_arrivals, NUM_SCANNERS
 
 def analyze_arrival_patterns():
     """
@@ -18,12 +13,12 @@ def analyze_arrival_patterns():
     print("ARRIVAL PATTERN ANALYSIS: WHERE DO ADDITIONAL PATIENTS ARRIVE?")
     print("=" * 80)
     
-    # Set random seed for consistent results
-    random.seed(42)
+    # Seed for consistent results (each day and scenario gets its own stream)
+    seed = 42
     
-    # Analyze arrival patterns across multiple days
-    baseline_hourly_totals = {hour: 0 for hour in range(24)}
-    rovis_hourly_totals = {hour: 0 for hour in range(24)}
+    # Analyze arrival patterns across multiple days (arrival counts per hour of day)
+    baseline_hourly_totals = np.zeros(24, dtype=np.int64)
+    rovis_hourly_totals = np.zeros(24, dtype=np.int64)
     
     num_days = 10  # Analyze 10 days for better patterns
     
@@ -32,22 +27,17 @@ def analyze_arrival_patterns():
     
     for day in range(num_days):
         # Generate arrivals for each scenario
-        baseline_arrivals = generate_patient_arrivals('baseline')
-        rovis_arrivals = generate_patient_arrivals('rovis_only')
+        baseline_arrivals = generate_patient_arrivals('baseline', seed=[seed, day, 0])
+        rovis_arrivals = generate_patient_arrivals('rovis_only', seed=[seed, day, 1])
         
         baseline_daily_totals.append(len(baseline_arrivals))
         rovis_daily_totals.append(len(rovis_arrivals))
         
-        # Count by hour
-        for arrival in baseline_arrivals:
-            hour = int(arrival // 60)
-            if hour < 24:
-                baseline_hourly_totals[hour] += 1
-        
-        for arrival in rovis_arrivals:
-            hour = int(arrival // 60)
-            if hour < 24:
-                rovis_hourly_totals[hour] += 1
+        # Count by hour (arrivals after midnight fall outside the day and are dropped)
+        baseline_hours = (np.asarray(baseline_arrivals) // 60).astype(np.int32)
+        rovis_hours = (np.asarray(rovis_arrivals) // 60).astype(np.int32)
+        baseline_hourly_totals += np.bincount(baseline_hours[baseline_hours < 24], minlength=24)
+        rovis_hourly_totals += np.bincount(rovis_hours[rovis_hours < 24], minlength=24)
     
     # Calculate averages
     baseline_avg_daily = statistics.mean(baseline_daily_totals)
@@ -73,13 +73,13 @@ def plot_gantt(gantt_df):
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 6))
 
-    # Draw bars
-    for _, row in gantt_df.iterrows():
-        step_name = row['Step']
-        scen = row['Scenario']
-        start = row['Start']
-        dur = row['Duration']
-
+    # Draw bars (zip over the column arrays; iterrows would build a Series per row)
+    for step_name, scen, start, dur in zip(
+        gantt_df['Step'].to_numpy(),
+        gantt_df['Scenario'].to_numpy(),
+        gantt_df['Start'].to_numpy(),
+        gantt_df['Duration'].to_numpy(),
+    ):
         base_y = step_to_y[step_name]
 
         if step_a_name is not None and step_name == step_a_name:
@@ -5,6 +5,7 @@
 # - Legend in lower-left inside the plot
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 # 1. Data setup
@@ -28,7 +29,11 @@ ct_data = [
     ['Rovis + Workflow Redesign', 'A. Scheduling → Request',            0.0, 35],
 ]
 
-ct_df = pd.DataFrame(ct_data, columns=['Scenario', 'Step', 'Start', 'Duration'])
+# Fixed-width record layout: Start/Duration come out as float32 columns and
+# pandas doesn't have to infer a type for each row
+ct_dtype = np.dtype([('Scenario', 'U32'), ('Step', 'U64'), ('Start', 'f4'), ('Duration', 'f4')])
+ct_arr = np.array([tuple(row) for row in ct_data], dtype=ct_dtype)
+ct_df = pd.DataFrame.from_records(ct_arr)
 
 # 2. Step order (top to bottom on chart)
 step_order_internal = [
@@ -79,19 +84,20 @@ fig, ax = plt.subplots(figsize=(10, 4))
 
 for scen in scenarios:
     sub = ct_df[ct_df['Scenario'] == scen]
-    for _, row in sub.iterrows():
-        base_y = y_positions[row['Step']]
+    # zip over the column arrays; iterrows would build a Series per row
+    for step, start, dur in zip(sub['Step'].to_numpy(), sub['Start'].to_numpy(), sub['Duration'].to_numpy()):
+        base_y = y_positions[step]
         y = base_y
         height = bar_height
 
         # Special vertical offsets ONLY for the Scheduling step
-        if row['Step'] == 'A. Scheduling → Request':
+        if step == 'A. Scheduling → Request':
             y = base_y + scheduling_offsets[scen]
 
         ax.barh(
             y=y,
-            left=row['Start'],
-            width=row['Duration'],
+            left=start,
+            width=dur,
             color=colors[scen],
             edgecolor='black',
             hatch=hatches[scen],
@@ -1,12 +1,13 @@
 import math
 import random
-import statistics
+import numpy as np
 import pandas as pd
 
 # -----------------------------
 # Global assumptions
 # -----------------------------
 random.seed(42)  # Fix the random number generator so the script produces the same "random" draws every run with options
+NP_RNG = np.random.default_rng(42)  # Same idea for the NumPy draws that build the pre-mixed delay pools
 
 NUM_SCANNERS = 6
 EXAMS_PER_DAY_PER_SCANNER = 12          # ~72 inpatient CT/day total
@@ -19,6 +20,11 @@ ROBOT_UPTIME = 0.80                     # 80% of exams see improved delay; 20% b
 
 N_SIM_DAYS = 1000                       # Monte Carlo replications
 
+# Delay distributions as (mean minutes, lognormal sigma)
+BASELINE_DELAY = (79, 0.5)              # Baseline total delay
+TRANSPORT_IDEAL_DELAY = (68, 0.4)       # Improved transport only
+WORKFLOW_IDEAL_DELAY = (51, 0.35)       # Improved transport + workflow
+
 # -----------------------------
 # Helper: one lognormal draw with a given average
 # -----------------------------
@@ -33,29 +39,40 @@ def lognormal_with_mean(mean, sigma):
 # -----------------------------
 def delay_baseline():
     # Baseline total delay ~ 79 minutes on average
-    return lognormal_with_mean(79, 0.5)
+    return lognormal_with_mean(*BASELINE_DELAY)
 
 def delay_rovex_transport_ideal():
     # Improved transport only: about 68 minutes on average
-    return lognormal_with_mean(68, 0.4)
+    return lognormal_with_mean(*TRANSPORT_IDEAL_DELAY)
 
 def delay_rovex_workflow_ideal():
     # Improved transport + workflow: about 51 minutes on average
-    return lognormal_with_mean(51, 0.35)
+    return lognormal_with_mean(*WORKFLOW_IDEAL_DELAY)
+
+def premixed_delays(improved_mean, improved_sigma, batch=N_SIM_DAYS * EXAMS_PER_DAY_PER_SCANNER):
+    # Endless stream of uptime-mixed delays. Each batch draws the uptime coin flips,
+    # the improved delays and the baseline delays in one go and picks with
+    # np.where, so the per-exam delay function just takes the next value.
+    while True:
+        robot_up = NP_RNG.random(batch) < ROBOT_UPTIME
+        improved = NP_RNG.lognormal(math.log(improved_mean) - 0.5 * improved_sigma**2, improved_sigma, batch)
+        baseline_mean, baseline_sigma = BASELINE_DELAY
+        baseline = NP_RNG.lognormal(math.log(baseline_mean) - 0.5 * baseline_sigma**2, baseline_sigma, batch)
+        yield from np.where(robot_up, improved, baseline).tolist()
+
+# One pre-mixed pool per mixture scenario (same means/sigmas as the ideal functions above)
+MIXED_POOL = {
+    'rovex_transport': premixed_delays(*TRANSPORT_IDEAL_DELAY),
+    'rovex_workflow': premixed_delays(*WORKFLOW_IDEAL_DELAY),
+}
 
 def delay_rovex_transport_uptime():
     # Mixture for transport-only scenario with 80% uptime. With prob 0.8, use improved (68); with prob 0.2, use baseline (79).
-    if random.random() < ROBOT_UPTIME:
-        return delay_rovex_transport_ideal()
-    else:
-        return delay_baseline()
+    return next(MIXED_POOL['rovex_transport'])
 
 def delay_rovex_workflow_uptime():
     # Mixture for transport + workflow scenario with 80% uptime. With prob 0.8, use improved (51); with prob 0.2, use baseline (79).
-    if random.random() < ROBOT_UPTIME:
-        return delay_rovex_workflow_ideal()
-    else:
-        return delay_baseline()
+    return next(MIXED_POOL['rovex_workflow'])
 
 # -----------------------------
 # Exam duration model (minutes)
@@ -98,8 +115,10 @@ def simulate_day(delay_fn):
 # -----------------------------
 def run_avg_idle(delay_fn, n_days=N_SIM_DAYS):
 #  Run the single-day simulation n_days times and return the average idle minutes per day per scanner.
-    idles = [simulate_day(delay_fn) for _ in range(n_days)]
-    return statistics.mean(idles)
+    total = 0.0
+    for _ in range(n_days):
+        total += simulate_day(delay_fn)
+    return total / n_days
 
 # -----------------------------
 # Compute average idle for each scenario
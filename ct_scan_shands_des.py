@@ -4,6 +4,14 @@ import statistics
 import simpy
 import pandas as pd
 
+# Resource counts and the Shands workflow timings are shared with the
+# simpy-free arrival model, so both files read the same values
+from ct_scan_arrivals import (
+    NUM_SCANNERS, NUM_ROBOTS, DAY_LENGTH_MIN,
+    BOOKING_CONVERSION, STEP_MEANS, STEP_SIGMA,
+    get_theoretical_total, daily_patient_capacity,
+)
+
 # =============================================================================
 # SIMULATION SETUP - What we're testing
 # =============================================================================
@@ -20,80 +28,16 @@ random.seed(42)  # Makes results repeatable
 # =============================================================================
 # HOSPITAL CONFIGURATION - How many resources we have
 # =============================================================================
-NUM_SCANNERS = 6                    # Total CT scanners available
-NUM_ROBOTS = 9                      # Number of transport robots
-DAY_LENGTH_MIN = 24 * 60           # 24-hour operation in minutes
 OPERATING_DAYS_PER_YEAR = 360      # Days hospital operates per year
 
 # =============================================================================
 # FINANCIAL ASSUMPTIONS - Money calculations
 # =============================================================================
 CT_CM_PER_SCAN = 484               # Contribution margin per CT scan
-BOOKING_CONVERSION = 0.60          # 60% of freed time converts to new scans (moderate absorption)
 ROBOT_UPTIME = 0.80                # Robots work 80% of the time (20% downtime)
 
 N_SIM_DAYS = 100                  # Run simulation 100 times for testing (change back to 1000 for final results)
 
-# =============================================================================
-# WORKFLOW-DERIVED CAPACITY MODEL - Calculate capacity from actual workflow times
-# =============================================================================
-# No artificial demand constraints - let workflow efficiency determine capacity
-# Baseline capacity calculated from actual Shands workflow times
-SCANNER_HOURS_PER_DAY = 24 * 60       # Minutes available per scanner per day
-AVG_SCAN_DURATION = 12.11             # Minutes per scan (from C3 step)
-
-# =============================================================================
-# WORKFLOW TIMINGS - How long each step takes (in minutes)
-# =============================================================================
-# Data from Shands TaT Report - Real measured times
-# Steps explained:
-# P = CT order placed to CT scheduled (protocoling)
-# A = CT scheduled to transport requested (waiting for transport queue)
-# B1 = Transport requested to assigned (waiting for transporter)
-# B2 = Transport assigned to acknowledged (transporter acknowledges)
-# B3 = Transport acknowledge to start (delays before moving patient)
-# C1 = Transport start to Transport end (moving patient)
-# C2 = Transport end to CT start (arrival to scanner prep)
-# C3 = CT start to CT end (actual scan)
-STEP_MEANS = {
-    'P': {'baseline': 27.43, 'rovis_only': 27.43, 'rovis_workflow': 27.43},    # P: CT order placed → CT scheduled (protocoling)
-    'A': {'baseline': 51.67, 'rovis_only': 51.67, 'rovis_workflow': 35.0},     # A: CT scheduled → transport requested (queue wait)
-    'B1': {'baseline': 11.77, 'rovis_only': 2.94, 'rovis_workflow': 2.94},     # B1: Transport requested → transporter assigned
-    'B2': {'baseline': 3.38, 'rovis_only': 0.85, 'rovis_workflow': 0.85},      # B2: Transport assigned → transporter acknowledges
-    'B3': {'baseline': 6.55, 'rovis_only': 1.64, 'rovis_workflow': 1.64},      # B3: Acknowledge → transport start (patient prep delay)
-    'C1': {'baseline': 5.0, 'rovis_only': 5.0, 'rovis_workflow': 5.0},         # C1: Transport start → transport end (movement)
-    'C2': {'baseline': 1.6, 'rovis_only': 1.6, 'rovis_workflow': 1.6},         # C2: Transport end → CT start (scanner prep)
-    'C3': {'baseline': 12.11, 'rovis_only': 12.11, 'rovis_workflow': 12.11},   # C3: CT start → CT end (scan time)
-}
-# Variability in timing (standard deviation estimates)
-# These values are std‑dev factors used with the log‑normal generator.
-# Rationale:
-#  - Admin/queue steps (P, A, B1, B3) show higher variability due to staffing/queueing.
-#  - Operational acknowledgements (B2) are moderately variable.
-#  - Movement/scan prep (C1, C2) are more consistent (lower variability).
-#  - Scan time (C3) has clinical variability but is tighter than queueing steps.
-STEP_SIGMA = {
-    'P': 0.30,  # Protocoling (CT order → scheduled) - moderate variability
-    'A': 0.35,  # CT scheduled → transport requested (queue wait) - moderate/high
-    'B1': 0.40, # Transport requested → transporter assigned - high variability
-    'B2': 0.30, # Transport assigned → transport acknowledged - moderate variability
-    'B3': 0.40, # Acknowledge → transport start (patient readiness delays) - high
-    'C1': 0.20, # Transport start → transport end (movement) - lower variability
-    'C2': 0.15, # Transport end → CT start (scanner prep) - low variability
-    'C3': 0.25, # CT start → CT end (scan time) - clinical variability
-}
-
-# Order of steps for calculating totals
-STEP_ORDER = ['P', 'A', 'B1', 'B2', 'B3', 'C1', 'C2', 'C3']
-
-def get_theoretical_total(scenario_name):
-    """
-    Return the theoretical total used for reporting based on STEP_MEANS.
-    Uses the precise STEP_MEANS values and returns a single-decimal rounded value
-    for display (no forced/display-only map).
-    """
-    return round(sum(STEP_MEANS[step][scenario_name] for step in STEP_ORDER), 1)
-
 # =============================================================================
 # HELPER FUNCTIONS - Small utility functions
 # =============================================================================
@@ -150,40 +94,8 @@ def generate_patient_arrivals_workflow_derived(scenario_name='baseline'):
         List of arrival times (in minutes from start of day)
     """
     
-    # Calculate daily processing capacity from workflow times
-    # Start with known baseline: 25 CT scans per day
-    baseline_daily_capacity = 25.0
-    
-    if scenario_name == 'baseline':
-        daily_patients = baseline_daily_capacity
-    else:
-        # Calculate transport time improvement
-        baseline_transport_time = (
-            get_theoretical_total('baseline') - 
-            27.43 - 12.11  # Subtract P and C3 (non-transport steps)
-        )
-        scenario_transport_time = (
-            get_theoretical_total(scenario_name) - 
-            27.43 - 12.11  # Subtract P and C3 (non-transport steps) 
-        )
-        
-        # Calculate capacity improvement factor from transport efficiency
-        if baseline_transport_time > 0:
-            capacity_improvement = baseline_transport_time / scenario_transport_time
-        else:
-            capacity_improvement = 1.0
-        
-        # Improved capacity = baseline capacity * transport efficiency gain
-        theoretical_improved_capacity = baseline_daily_capacity * capacity_improvement
-        
-        # Apply booking conversion factor - not all efficiency gains convert to actual patients
-        improved_daily_capacity = baseline_daily_capacity + ((theoretical_improved_capacity - baseline_daily_capacity) * BOOKING_CONVERSION)
-        
-        # Limited only by maximum scanner capacity (not artificial demand limits)
-        max_scanner_capacity = (SCANNER_HOURS_PER_DAY * NUM_SCANNERS) / AVG_SCAN_DURATION
-        
-        # Actual capacity = min(workflow-derived capacity, physical scanner limit)
-        daily_patients = min(improved_daily_capacity, max_scanner_capacity)
+    # Daily processing capacity from workflow times (baseline: 25 CT scans per day)
+    daily_patients = daily_patient_capacity(scenario_name)
     
     arrival_times = []
     
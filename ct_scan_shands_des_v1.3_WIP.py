@@ -1,6 +1,8 @@
 import math
 import random
 import statistics
+from functools import lru_cache
+import numpy as np
 import simpy
 
 # =============================================================================
@@ -15,7 +17,8 @@ import simpy
 # 3. Rovis + Workflow: Robots + improved hospital workflows
 # 4. Workflow Only: Human transport, but faster workflow step A
 
-random.seed(42)  # Makes results repeatable
+RANDOM_SEED = 42
+random.seed(RANDOM_SEED)  # Makes results repeatable
 
 # =============================================================================
 # HOSPITAL CONFIGURATION - How many resources we have
@@ -96,40 +99,61 @@ for _step_name in STEP_ORDER:
     STEP_MEANS[_step_name]['wf_only'] = STEP_MEANS[_step_name]['baseline']
 STEP_MEANS['A']['wf_only'] = 35.0
 
+# Log-normal mu for every (step, scenario) pair, computed once at import
+# (same formula as generate_random_time_with_average)
+STEP_LOG_MU = {
+    step: {scen: math.log(mean) - 0.5 * STEP_SIGMA[step]**2 for scen, mean in scen_means.items()}
+    for step, scen_means in STEP_MEANS.items()
+}
+
+@lru_cache(maxsize=None)
+def _theoretical_total_raw(scenario_name):
+    """
+    Unrounded sum of STEP_MEANS over STEP_ORDER for a scenario.
+    Used for internal capacity math; STEP_MEANS never changes after import,
+    so each scenario is summed once.
+    """
+    return sum(STEP_MEANS[step][scenario_name] for step in STEP_ORDER)
+
+
+@lru_cache(maxsize=8)
 def get_theoretical_total(scenario_name):
     """
     Return the theoretical total used for reporting based on STEP_MEANS.
     Uses the precise STEP_MEANS values and returns a single-decimal rounded value
-    for display (no forced/display-only map).
+    for display (no forced/display-only map). Cached per scenario name.
     """
-    return round(sum(STEP_MEANS[step][scenario_name] for step in STEP_ORDER), 1)
+    return round(_theoretical_total_raw(scenario_name), 1)
 
 # =============================================================================
 # HELPER FUNCTIONS - Small utility functions
 # =============================================================================
 
-def generate_random_time_with_average(average_time, variability):
+def generate_random_time_with_average(average_time, variability, rng=random):
     """
     Generate a random time that averages to a specific value.
     Uses log-normal distribution (realistic for medical processes).
     
     Example: If average is 10 minutes, might return 9.2, 10.5, 11.3, etc.
+
+    rng is the random source (a random.Random instance, or the global
+    random module by default); the same applies to the helpers below.
     """
     mu = math.log(average_time) - 0.5 * variability**2
-    return random.lognormvariate(mu, variability)
+    return rng.lognormvariate(mu, variability)
 
 
-def get_step_duration(step_name, scenario_name):
+def get_step_duration(step_name, scenario_name, rng=random):
     """
     Return duration for a step using stochastic draws for ALL scenarios.
     - Uses STEP_MEANS as the mean and STEP_SIGMA for variability.
     """
     average_time = STEP_MEANS[step_name][scenario_name]
     variability = STEP_SIGMA.get(step_name, 0.3)
-    return generate_random_time_with_average(average_time, variability)
+    return generate_random_time_with_average(average_time, variability, rng)
 
 
-def generate_exam_duration():
+def generate_exam_duration(rng=random):
     """
     Generate a realistic CT exam duration.
     Average is 12 minutes, but can vary from 5 to 25 minutes.
@@ -138,14 +162,15 @@ def generate_exam_duration():
         Exam duration in minutes
     """
     while True:
-        duration = random.gauss(12, 3)  # Mean=12, std dev=3
+        duration = rng.gauss(12, 3)  # Mean=12, std dev=3
         if 5 <= duration <= 25:         # Keep only realistic values
             return duration
 
 
 def generate_patient_arrivals_workflow_derived(scenario_name='baseline',
                                               deterministic=False,
-                                              deterministic_daily_patients=None):
+                                              deterministic_daily_patients=None,
+                                              rng=random):
     """
     Generate patient arrivals based on workflow-derived processing capacity.
     
@@ -157,6 +182,7 @@ def generate_patient_arrivals_workflow_derived(scenario_name='baseline',
     
     Args:
         scenario_name: Which scenario we're simulating
+        rng: Random source for the stochastic arrivals
     
     Returns:
         List of arrival times (in minutes from start of day)
@@ -173,11 +199,11 @@ def generate_patient_arrivals_workflow_derived(scenario_name='baseline',
     else:
         # Calculate transport time improvement
         baseline_transport_time = (
-            get_theoretical_total('baseline') - 
+            _theoretical_total_raw('baseline') - 
             27.43 - 12.11  # Subtract P and C3 (non-transport steps)
         )
         scenario_transport_time = (
-            get_theoretical_total(scenario_name) - 
+            _theoretical_total_raw(scenario_name) - 
             27.43 - 12.11  # Subtract P and C3 (non-transport steps) 
         )
         
@@ -226,22 +252,22 @@ def generate_patient_arrivals_workflow_derived(scenario_name='baseline',
                     arrival_times.append(hour_start_min + spacing * (i + 1))
         else:
             # Generate arrivals for this hour using Poisson process
+            if expected_arrivals <= 0:
+                continue
+            avg_inter_arrival_min = 60.0 / expected_arrivals  # Constant within the hour
             current_time = hour_start_min
-            while current_time < hour_end_min and expected_arrivals > 0:
-                if expected_arrivals > 0:
-                    avg_inter_arrival_min = 60.0 / expected_arrivals
-                    inter_arrival_time = random.expovariate(1.0 / avg_inter_arrival_min)
-                    current_time += inter_arrival_time
-                    
-                    if current_time < hour_end_min:
-                        arrival_times.append(current_time)
-                else:
-                    break
+            while current_time < hour_end_min:
+                # Inverse-CDF exponential draw (1 - U keeps log() away from 0)
+                inter_arrival_time = -math.log(1.0 - rng.random()) * avg_inter_arrival_min
+                current_time += inter_arrival_time
+
+                if current_time < hour_end_min:
+                    arrival_times.append(current_time)
     
     return arrival_times
 
 
-def generate_robot_repositioning_time():
+def generate_robot_repositioning_time(rng=random):
     """
     Generate robot repositioning time after dropping off a patient.
     Robots need to travel from CT area back to patient pickup locations.
@@ -252,12 +278,40 @@ def generate_robot_repositioning_time():
     """
     # Average 10 minutes, range 5-15 minutes for large hospital
     while True:
-        reposition_time = random.gauss(10.0, 2.0)  # Mean=10, std dev=2.0
+        reposition_time = rng.gauss(10.0, 2.0)  # Mean=10, std dev=2.0
         if 5.0 <= reposition_time <= 15.0:  # Keep realistic range
             return reposition_time
 
 
-def calculate_robot_time(scenario_name):
+# Steps summed by the robot-occupancy and patient-transport totals
+ROBOT_TIME_STEPS = ('B1', 'B2', 'B3', 'C1')
+TRANSPORT_TIME_STEPS = ('A', 'B1', 'B2', 'B3', 'C1', 'C2')
+
+
+def _make_step_sum_fn(steps, scenario_name, add_repositioning=False):
+    """
+    Build a draw function specialized to one scenario, called as fn(rng).
+    The (mu, sigma) pairs are looked up once here, so each call only
+    makes the log-normal draws (in the same order as get_step_duration).
+    """
+    params = tuple((STEP_LOG_MU[step][scenario_name], STEP_SIGMA[step]) for step in steps)
+    if add_repositioning:
+        return lambda rng=random: sum(rng.lognormvariate(mu, sigma) for mu, sigma in params) + generate_robot_repositioning_time(rng)
+    return lambda rng=random: sum(rng.lognormvariate(mu, sigma) for mu, sigma in params)
+
+
+# One specialized draw function per scenario: ROBOT_TIME_FNS[scenario](rng)
+ROBOT_TIME_FNS = {
+    scen: _make_step_sum_fn(ROBOT_TIME_STEPS, scen, add_repositioning=True)
+    for scen in STEP_MEANS['A']
+}
+TRANSPORT_TIME_FNS = {
+    scen: _make_step_sum_fn(TRANSPORT_TIME_STEPS, scen)
+    for scen in STEP_MEANS['A']
+}
+
+
+def calculate_robot_time(scenario_name, rng=random):
     """
     Calculate time robot is occupied (B1 + B2 + B3 + C1 + repositioning).
     After repositioning, robot is free to help another patient.
@@ -268,15 +322,9 @@ def calculate_robot_time(scenario_name):
     Returns:
         Robot occupation time in minutes
     """
-    return (
-        get_step_duration('B1', scenario_name) +
-        get_step_duration('B2', scenario_name) +
-        get_step_duration('B3', scenario_name) +
-        get_step_duration('C1', scenario_name) +
-        generate_robot_repositioning_time()  # Add repositioning time
-    )
+    return ROBOT_TIME_FNS[scenario_name](rng)
 
-def calculate_patient_transport_time(scenario_name):
+def calculate_patient_transport_time(scenario_name, rng=random):
     """
     Calculate total patient transport time (A + B1 + B2 + B3 + C1 + C2).
     This is how long patient waits from scheduling to reaching scanner.
@@ -287,28 +335,20 @@ def calculate_patient_transport_time(scenario_name):
     Returns:
         Total patient transport time in minutes
     """
-    total_time = (
-        get_step_duration('A', scenario_name) +
-        get_step_duration('B1', scenario_name) +
-        get_step_duration('B2', scenario_name) +
-        get_step_duration('B3', scenario_name) +
-        get_step_duration('C1', scenario_name) +
-        get_step_duration('C2', scenario_name)
-    )
-    return total_time
+    return TRANSPORT_TIME_FNS[scenario_name](rng)
 
 # =============================================================================
 # SCANNER DOWNTIME MODEL - Simple fixed downtime per scanner
 # =============================================================================
 
-def apply_scanner_downtime(env, scanners, downtime_minutes):
+def apply_scanner_downtime(env, scanners, downtime_minutes, rng=random):
     """
     Block one scanner for a contiguous downtime window within the day.
     Downtime start is randomized; duration is fixed.
     """
     if downtime_minutes <= 0:
         return
-    start = random.uniform(0, max(0.0, DAY_LENGTH_MIN - downtime_minutes))
+    start = rng.uniform(0, max(0.0, DAY_LENGTH_MIN - downtime_minutes))
     yield env.timeout(start)
     with scanners.request() as req:
         yield req
@@ -319,7 +359,7 @@ def apply_scanner_downtime(env, scanners, downtime_minutes):
 # =============================================================================
 
 def simulate_one_patient(env, patient_id, scheduled_time, scanners, robots, 
-                        scenario_name, collected_metrics, scanner_events):
+                        scenario_name, collected_metrics, scanner_events, rng=random):
     """
     Simulate one patient's journey from request to completed CT scan.
     
@@ -336,8 +376,9 @@ def simulate_one_patient(env, patient_id, scheduled_time, scanners, robots,
         scanners: Pool of available CT scanners
         robots: Pool of available robots (None for baseline)
         scenario_name: Which scenario we're running
-        collected_metrics: Dictionary to store wait times
+        collected_metrics: Dictionary of preallocated wait-time arrays and fill counters
         scanner_events: List to track when scanners are used
+        rng: Random source for this day's draws
     """
     # STEP 1: Wait until this patient's scheduled time
     yield env.timeout(scheduled_time)
@@ -345,11 +386,11 @@ def simulate_one_patient(env, patient_id, scheduled_time, scanners, robots,
     # STEP 2: Transport patient to CT area
     if scenario_name in ("baseline", "wf_only"):
         # Baseline = manual transport, no robot needed
-        transport_time = calculate_patient_transport_time('baseline')
+        transport_time = TRANSPORT_TIME_FNS['baseline'](rng)
         yield env.timeout(transport_time)
     else:
         # Step A: Queue wait (happens before robot is needed)
-        step_a_time = get_step_duration('A', scenario_name)
+        step_a_time = get_step_duration('A', scenario_name, rng)
         yield env.timeout(step_a_time)
         
         # Steps B1-B3+C1: Robot-assisted transport
@@ -363,20 +404,16 @@ def simulate_one_patient(env, patient_id, scheduled_time, scanners, robots,
             
             # Record how long we waited for a robot
             robot_wait_time = time_when_robot_available - time_when_robot_requested
-            collected_metrics['robot_waits'].append(robot_wait_time)
+            collected_metrics['robot_waits'][collected_metrics['rw_n']] = robot_wait_time
+            collected_metrics['rw_n'] += 1
 
             # Robots have 80% uptime - 20% of time they fail and we revert to manual
-            if random.random() < ROBOT_UPTIME:
-                robot_time = calculate_robot_time(scenario_name)
+            if rng.random() < ROBOT_UPTIME:
+                robot_time = ROBOT_TIME_FNS[scenario_name](rng)
             else:
                 # Robot failed - use manual times for B1-B3+C1+repositioning
-                robot_time = (
-                    get_step_duration('B1', 'baseline') +
-                    get_step_duration('B2', 'baseline') +
-                    get_step_duration('B3', 'baseline') +
-                    get_step_duration('C1', 'baseline') +
-                    generate_robot_repositioning_time()  # Even failed robots need to reposition
-                )
+                # (even failed robots need to reposition)
+                robot_time = ROBOT_TIME_FNS['baseline'](rng)
 
             yield env.timeout(robot_time)
             # Track robot busy time
@@ -385,7 +422,7 @@ def simulate_one_patient(env, patient_id, scheduled_time, scanners, robots,
             # Robot is now free to help another patient after repositioning!
         
         # Step C2: Scanner prep (no robot needed)
-        step_c2_time = get_step_duration('C2', scenario_name)
+        step_c2_time = get_step_duration('C2', scenario_name, rng)
         yield env.timeout(step_c2_time)
 
     # STEP 3: Request a CT scanner (might have to wait if all scanners busy)
@@ -397,7 +434,8 @@ def simulate_one_patient(env, patient_id, scheduled_time, scanners, robots,
         
         # Record how long we waited for a scanner
         ct_wait_time = time_when_ct_starts - time_when_ct_requested
-        collected_metrics['ct_waits'].append(ct_wait_time)
+        collected_metrics['ct_waits'][collected_metrics['cw_n']] = ct_wait_time
+        collected_metrics['cw_n'] += 1
 
         # Record when this scanner started being used
         scanner_events.append({
@@ -407,28 +445,33 @@ def simulate_one_patient(env, patient_id, scheduled_time, scanners, robots,
         })
         
         # STEP 4: Perform the actual CT exam
-        exam_time = generate_exam_duration()
+        exam_time = generate_exam_duration(rng)
         total_scanner_time = exam_time + TURNOVER_MINUTES  # include turnover/setup while scanner is occupied
         scanner_events[-1]['end'] = time_when_ct_starts + total_scanner_time
         yield env.timeout(total_scanner_time)
 
 
-def simulate_one_day(scenario_name):
+def simulate_one_day(scenario_name, seed=None):
     """
     Simulate one complete day of CT operations.
     Creates all patients, runs the simulation, calculates idle time.
     
     Args:
         scenario_name: Which scenario to simulate
+        seed: Seed for this day's private random.Random; None falls back to
+              the shared global random state
     
     Returns:
         Dictionary with metrics from this day:
-        - robot_waits: List of robot wait times
-        - ct_waits: List of CT scanner wait times
+        - robot_waits: Array of robot wait times
+        - ct_waits: Array of CT scanner wait times
         - idle_per_scanner: Average idle time per scanner
         - total_patients: Number of patients who arrived
         - completed_scans: Number of scans completed
     """
+    # Per-day random source so days can be replayed (or run in parallel) independently
+    rng = random.Random(seed) if seed is not None else random
+
     # Set up the simulation environment
     env = simpy.Environment()
     scanners = simpy.Resource(env, capacity=NUM_SCANNERS)
@@ -436,24 +479,28 @@ def simulate_one_day(scenario_name):
     # Robots only exist in non-baseline scenarios
     robots = None if scenario_name in ("baseline", "wf_only") else simpy.Resource(env, capacity=NUM_ROBOTS)
 
-    # Storage for collected data
-    collected_metrics = {'robot_waits': [], 'ct_waits': []}
-    scanner_events = []
-    robot_busy_minutes = 0.0
-
     # Generate patient arrivals based on workflow-derived processing capacity
-    arrival_times = generate_patient_arrivals_workflow_derived(scenario_name)
+    arrival_times = generate_patient_arrivals_workflow_derived(scenario_name, rng=rng)
+
+    # Storage for collected data - at most one wait of each kind per patient,
+    # so size the arrays up front and track how many slots are filled
+    n_patients = len(arrival_times)
+    collected_metrics = {
+        'robot_waits': np.empty(n_patients), 'ct_waits': np.empty(n_patients),
+        'rw_n': 0, 'cw_n': 0,
+    }
+    scanner_events = []
 
     # Block each scanner for planned/unplanned downtime (10% of day) at a random time
     downtime_minutes = DAY_LENGTH_MIN * (1.0 - SCANNER_UPTIME)
     for _ in range(NUM_SCANNERS):
-        env.process(apply_scanner_downtime(env, scanners, downtime_minutes))
+        env.process(apply_scanner_downtime(env, scanners, downtime_minutes, rng))
     
     # Schedule all patients based on their arrival times
     for patient_id, arrival_time in enumerate(arrival_times):
         env.process(simulate_one_patient(
             env, patient_id, arrival_time, scanners, robots,
-            scenario_name, collected_metrics, scanner_events
+            scenario_name, collected_metrics, scanner_events, rng
         ))
 
     # Run the simulation (full day + 4 hours buffer)
@@ -493,8 +540,8 @@ def simulate_one_day(scenario_name):
     avg_scanner_util_percent = statistics.mean(util_per_scanner) if util_per_scanner else 0.0
 
     return {
-        'robot_waits': collected_metrics['robot_waits'],
-        'ct_waits': collected_metrics['ct_waits'],
+        'robot_waits': collected_metrics['robot_waits'][:collected_metrics['rw_n']],
+        'ct_waits': collected_metrics['ct_waits'][:collected_metrics['cw_n']],
         'idle_per_scanner': average_idle_per_scanner,
         'total_patients': len(arrival_times),
         'completed_scans': len(completed_exams),
@@ -526,11 +573,12 @@ def run_many_simulations(scenario_name):
     all_scanner_utils = []
     all_robot_busy = []
     
-    # Run simulation N_SIM_DAYS times
+    # Run simulation N_SIM_DAYS times; day N always uses seed RANDOM_SEED + N,
+    # so every scenario sees the same sequence of seeded days
     for day_num in range(N_SIM_DAYS):
-        day_result = simulate_one_day(scenario_name)
-        all_robot_waits.extend(day_result['robot_waits'])
-        all_ct_waits.extend(day_result['ct_waits'])
+        day_result = simulate_one_day(scenario_name, seed=RANDOM_SEED + day_num)
+        all_robot_waits.append(day_result['robot_waits'])
+        all_ct_waits.append(day_result['ct_waits'])
         all_idle_times.append(day_result['idle_per_scanner'])
         all_total_patients.append(day_result['total_patients'])
         all_completed_scans.append(day_result['completed_scans'])
@@ -538,8 +586,10 @@ def run_many_simulations(scenario_name):
         all_robot_busy.append(day_result['robot_busy_minutes'])
     
     # Calculate averages
-    avg_robot_wait = statistics.mean(all_robot_waits) if all_robot_waits else 0.0
-    avg_ct_wait = statistics.mean(all_ct_waits) if all_ct_waits else 0.0
+    all_robot_waits = np.concatenate(all_robot_waits)
+    all_ct_waits = np.concatenate(all_ct_waits)
+    avg_robot_wait = float(all_robot_waits.mean()) if all_robot_waits.size else 0.0
+    avg_ct_wait = float(all_ct_waits.mean()) if all_ct_waits.size else 0.0
     avg_idle = statistics.mean(all_idle_times)
     avg_total_patients = statistics.mean(all_total_patients)
     avg_completed_scans = statistics.mean(all_completed_scans)
@@ -599,6 +649,9 @@ def calculate_new_scans_per_day(freed_minutes_per_scanner_per_day):
 # MAIN PROGRAM - Run simulations and print results
 # =============================================================================
 
+# Header text shared by both summary tables
+ALL_SCANNERS_HEADER = f"(All {NUM_SCANNERS})"
+
 if __name__ == "__main__":
     print("\n" + "="*100)
     print("CT SCANNER CAPACITY SIMULATION")
@@ -606,16 +659,6 @@ if __name__ == "__main__":
     
     # Calculate theoretical (perfect world) time savings from workflow table
     theoretical_baseline_time = get_theoretical_total('baseline')
-    theoretical_rovis_only_time = get_theoretical_total('rovis_only')
-    theoretical_rovis_workflow_time = get_theoretical_total('rovis_workflow')
-    theoretical_wf_only_time = get_theoretical_total('wf_only')
-    
-    # Calculate theoretical savings (if everything was perfect)
-    theoretical_savings = {
-        "rovis_only": theoretical_baseline_time - theoretical_rovis_only_time,
-        "rovis_workflow": theoretical_baseline_time - theoretical_rovis_workflow_time,
-        "wf_only": theoretical_baseline_time - theoretical_wf_only_time,
-    }
     
     # RUN BASELINE SIMULATION
     print(f"\nRunning baseline simulation ({N_SIM_DAYS} days)...")
@@ -624,38 +667,33 @@ if __name__ == "__main__":
     print(f"Baseline average patients/day: {baseline_patients:.1f} (arriving), {baseline_scans:.1f} (completed)")
     print(f"Theoretical baseline transport time: {theoretical_baseline_time:.1f} min\n")
 
-    # Column labels and shared helpers
-    daily_scans_label = f"Daily Scans (All {NUM_SCANNERS})"
-    per_scanner_label = "Scans per Day (per scanner)"
-    addl_per_scanner_label = "Add'l Scans/Day (per scanner)"
-    all_scanners_header = f"(All {NUM_SCANNERS})"
-
-    # Prepare data for summary tables
+    # Prepare data for summary tables; rows are tuples in column order:
+    # financial: (scenario, daily, per_scanner, addl_per, addl_total, monthly, annual, robot, scanner, idle)
+    # efficiency: (scenario, time_saved, daily, addl_daily, scanner_util)
     financial_table_data = []
     efficiency_table_data = []
     
     # Add baseline row (no improvements)
-    financial_table_data.append({
-        "Scenario": "Baseline - Manual Transport",
-        daily_scans_label: f"{baseline_scans:.1f}",
-        per_scanner_label: f"{baseline_scans/NUM_SCANNERS:.1f}",
-        addl_per_scanner_label: "0.0",
-        "Add'l Scans/Day (Total)": "0.0",
-        "Monthly Add'l CM": "$0",
-        "Annual Add'l CM": "$0",
-        "Robot Util %": "0.0%",
-        "Scanner Util %": f"{baseline_scanner_util:.1f}%",
-        "Idle per Scanner (min/day)": f"{baseline_idle:.1f}",
-    })
-
-    efficiency_table_data.append({
-        "Scenario": "Baseline - Manual Transport",
-        "Time Saved (min/exam)": "0.0",
-        daily_scans_label: f"{baseline_scans:.1f}",
-        "Add'l Daily Scans": "0.0",
-        "Idle per Scanner (min/day)": f"{baseline_idle:.1f}",
-        "Scanner Util %": f"{(baseline_scans/MAX_SCANNER_CAPACITY)*100:.1f}%",
-    })
+    financial_table_data.append((
+        "Baseline - Manual Transport",
+        f"{baseline_scans:.1f}",
+        f"{baseline_scans/NUM_SCANNERS:.1f}",
+        "0.0",
+        "0.0",
+        "$0",
+        "$0",
+        "0.0%",
+        f"{baseline_scanner_util:.1f}%",
+        f"{baseline_idle:.1f}",
+    ))
+
+    efficiency_table_data.append((
+        "Baseline - Manual Transport",
+        "0.0",
+        f"{baseline_scans:.1f}",
+        "0.0",
+        f"{(baseline_scans/MAX_SCANNER_CAPACITY)*100:.1f}%",
+    ))
 
     # RUN IMPROVEMENT SCENARIOS
     scenarios_to_test = [
@@ -669,37 +707,41 @@ if __name__ == "__main__":
         robot_wait, ct_wait, idle_time, total_patients, completed_scans, scanner_util, robot_util = run_many_simulations(scenario_key)
         
         # Calculate actual additional scans from simulation (not theoretical capacity)
-        theoretical_time_saved_per_exam = theoretical_savings[scenario_key]
+        theoretical_time_saved_per_exam = theoretical_baseline_time - get_theoretical_total(scenario_key)
         actual_additional_scans = completed_scans - baseline_scans
 
         # Financial impact from actual additional scans completed
         daily_additional_cm = actual_additional_scans * CT_CM_PER_SCAN
         monthly_additional_cm = daily_additional_cm * 30  # Monthly estimate
+        annual_additional_cm = monthly_additional_cm * 12
+
+        # Per-scanner views of the same results
+        scans_per_scanner = completed_scans / NUM_SCANNERS
+        additional_per_scanner = actual_additional_scans / NUM_SCANNERS
 
         # Add to financial table - showing ACTUAL simulation results
-        financial_table_data.append({
-            "Scenario": scenario_label,
-            daily_scans_label: f"{completed_scans:.1f}",
-            per_scanner_label: f"{completed_scans/NUM_SCANNERS:.1f}",
-            addl_per_scanner_label: f"{actual_additional_scans/NUM_SCANNERS:.1f}",
-            "Add'l Scans/Day (Total)": f"{actual_additional_scans:.1f}",
-            "Monthly Add'l CM": f"${monthly_additional_cm:,.0f}",
-            "Annual Add'l CM": f"${monthly_additional_cm * 12:,.0f}",
-            "Robot Util %": f"{robot_util:.1f}%",
-            "Scanner Util %": f"{scanner_util:.1f}%",
-            "Idle per Scanner (min/day)": f"{idle_time:.1f}",
-        })
+        financial_table_data.append((
+            scenario_label,
+            f"{completed_scans:.1f}",
+            f"{scans_per_scanner:.1f}",
+            f"{additional_per_scanner:.1f}",
+            f"{actual_additional_scans:.1f}",
+            f"${monthly_additional_cm:,.0f}",
+            f"${annual_additional_cm:,.0f}",
+            f"{robot_util:.1f}%",
+            f"{scanner_util:.1f}%",
+            f"{idle_time:.1f}",
+        ))
 
         # Show actual simulation results vs theoretical potential
         # Add to efficiency table (actuals only)
-        efficiency_table_data.append({
-            "Scenario": scenario_label,
-            "Time Saved (min/exam)": f"{theoretical_time_saved_per_exam:.1f}",
-            daily_scans_label: f"{completed_scans:.1f}",
-            "Add'l Daily Scans": f"{actual_additional_scans:.1f}",
-            "Idle per Scanner (min/day)": f"{idle_time:.1f}",
-            "Scanner Util %": f"{scanner_util:.1f}%",
-        })
+        efficiency_table_data.append((
+            scenario_label,
+            f"{theoretical_time_saved_per_exam:.1f}",
+            f"{completed_scans:.1f}",
+            f"{actual_additional_scans:.1f}",
+            f"{scanner_util:.1f}%",
+        ))
 
     # PRINT SUMMARY TABLES WITH CUSTOM FORMATTING
     print("\n" + "="*110)
@@ -736,7 +778,7 @@ if __name__ == "__main__":
     )
     print(
         f"{'':<{w['scenario']}}"
-        f"{all_scanners_header:>{w['daily']}}"
+        f"{ALL_SCANNERS_HEADER:>{w['daily']}}"
         f"{'(per scanner)':>{w['per_scan']}}"
         f"{'(per scanner)':>{w['addl_per']}}"
         f"{'(Total)':>{w['addl_total']}}"
@@ -748,17 +790,7 @@ if __name__ == "__main__":
     )
     print('-'*140)
 
-    for row in financial_table_data:
-        scenario = row["Scenario"]
-        daily = row[daily_scans_label]
-        per_scanner = row[per_scanner_label]
-        addl_per = row[addl_per_scanner_label]
-        addl_total = row["Add'l Scans/Day (Total)"]
-        monthly = row["Monthly Add'l CM"]
-        annual = row["Annual Add'l CM"]
-        robot = row["Robot Util %"]
-        scanner = row["Scanner Util %"]
-        idle = row["Idle per Scanner (min/day)"]
+    for scenario, daily, per_scanner, addl_per, addl_total, monthly, annual, robot, scanner, idle in financial_table_data:
         print(
             f"{scenario:<{w['scenario']}}"
             f"{daily:>{w['daily']}}"
@@ -778,10 +810,10 @@ if __name__ == "__main__":
     
     # Custom header formatting for Table 2 with proper column widths
     print(f"{'Scenario':<42} {'Time Saved':<12} {'Daily Scans':<13} {'Add\'l Daily':<12} {'Scanner':<10}")
-    print(f"{'':42} {'(min/exam)':<12} {all_scanners_header:<13} {'Scans':<12} {'Util %':<10}")
+    print(f"{'':42} {'(min/exam)':<12} {ALL_SCANNERS_HEADER:<13} {'Scans':<12} {'Util %':<10}")
     print("-"*130)
     
-    for row in efficiency_table_data:
-        print(f"{row['Scenario']:<42} {row['Time Saved (min/exam)']:<12} {row[daily_scans_label]:<13} {row['Add\'l Daily Scans']:<12} {row['Scanner Util %']:<10}")
+    for scenario, time_saved, daily, addl_daily, scanner_util in efficiency_table_data:
+        print(f"{scenario:<42} {time_saved:<12} {daily:<13} {addl_daily:<12} {scanner_util:<10}")
     
     print("="*130 + "\n")
@@ -1,16 +1,21 @@
 import math
-import random
-import statistics
-import pandas as pd
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy simulate_day below is used without it
+    njit = None
 
 # -----------------------------
 # Global assumptions
 # -----------------------------
-random.seed(42)  # Fix the random number generator so the script produces the same "random" draws every run with options
+SEED = 42  # Fix the random number generator so the script produces the same "random" draws every run with options
+RNG = np.random.default_rng(SEED)  # One PCG64 stream for the whole script; use RNG.spawn(n) for parallel substreams
 
 NUM_SCANNERS = 6
 EXAMS_PER_DAY_PER_SCANNER = 12          # ~72 inpatient CT/day total
 DAY_LENGTH_MIN = 12 * 60                # 12-hour CT day
+SCHED = np.arange(EXAMS_PER_DAY_PER_SCANNER) * (DAY_LENGTH_MIN / EXAMS_PER_DAY_PER_SCANNER)  # Planned schedule times (0, 60, ..., 660)
 OPERATING_DAYS_PER_YEAR = 360
 
 CT_CM_PER_HOUR = 2419                   # CT contribution margin per hour (USD)
@@ -20,98 +25,124 @@ ROBOT_UPTIME = 0.80                     # 80% of exams see improved delay; 20% b
 N_SIM_DAYS = 1000                       # Monte Carlo replications
 
 # -----------------------------
-# Helper: one lognormal draw with a given average
+# Helper: lognormal draws with a given average
 # -----------------------------
-def lognormal_with_mean(mean, sigma): 
-    # Return one positive random number whose average (over many draws)
+def lognormal_with_mean(mean, sigma, rng, size=None):
+    # Return positive random numbers (an array of shape `size`) whose average
     # will be about `mean`. `sigma` controls spread (bigger -> more variation)
     mu = math.log(mean) - 0.5 * sigma**2
-    return random.lognormvariate(mu, sigma)
+    return rng.lognormal(mu, sigma, size)
 
 # -----------------------------
 # Define Delay Functions (in minutes)
+# Each takes the NumPy generator and an output shape, e.g. (n_days, exams)
 # -----------------------------
-def delay_baseline():
+def delay_baseline(rng, size=None):
     # Baseline total delay ~ 79 minutes on average
-    return lognormal_with_mean(79, 0.5)
+    return lognormal_with_mean(79, 0.5, rng, size)
 
-def delay_rovex_transport_ideal():
+def delay_rovex_transport_ideal(rng, size=None):
     # Improved transport only: about 68 minutes on average
-    return lognormal_with_mean(68, 0.4)
+    return lognormal_with_mean(68, 0.4, rng, size)
 
-def delay_rovex_workflow_ideal():
+def delay_rovex_workflow_ideal(rng, size=None):
     # Improved transport + workflow: about 51 minutes on average
-    return lognormal_with_mean(51, 0.35)
-
-def delay_rovex_transport_uptime():
+    return lognormal_with_mean(51, 0.35, rng, size)
+
+def mix_by_uptime(improved_fn, fallback_fn, rng, size=None):
+    # Robot uptime mixture: one Bernoulli mask picks improved vs fallback per
+    # exam, and each delay model is drawn only for the slots it fills
+    robot_up = np.asarray(rng.random(size) < ROBOT_UPTIME)
+    n_up = int(robot_up.sum())
+    out = np.empty(robot_up.shape)
+    out[robot_up] = improved_fn(rng, n_up)
+    out[~robot_up] = fallback_fn(rng, robot_up.size - n_up)
+    return out if size is not None else float(out)
+
+def delay_rovex_transport_uptime(rng, size=None):
     # Mixture for transport-only scenario with 80% uptime. With prob 0.8, use improved (68); with prob 0.2, use baseline (79).
-    if random.random() < ROBOT_UPTIME:
-        return delay_rovex_transport_ideal()
-    else:
-        return delay_baseline()
+    return mix_by_uptime(delay_rovex_transport_ideal, delay_baseline, rng, size)
 
-def delay_rovex_workflow_uptime():
+def delay_rovex_workflow_uptime(rng, size=None):
     # Mixture for transport + workflow scenario with 80% uptime. With prob 0.8, use improved (51); with prob 0.2, use baseline (79).
-    if random.random() < ROBOT_UPTIME:
-        return delay_rovex_workflow_ideal()
-    else:
-        return delay_baseline()
+    return mix_by_uptime(delay_rovex_workflow_ideal, delay_baseline, rng, size)
 
 # -----------------------------
 # Exam duration model (minutes)
 # Shands-based: CT Start→End ≈ 12 min average
 # -----------------------------
-def exam_duration():
-    # Draw a CT exam time ~ Normal(12,3) but keep it between 5 and 25 minutes
-    while True:
-        x = random.gauss(12, 3)
-        if 5 <= x <= 25:
-            return x
-
-# -----------------------------
-# Simulate one CT scanner for one day
-# -----------------------------
-def simulate_day(delay_fn):
-  # Simulate a single day for one CT scanner using the provided delay function (baseline or Rovis scenario). Returns the total idle minutes that day.
-    schedule_interval = DAY_LENGTH_MIN / EXAMS_PER_DAY_PER_SCANNER  # 60 min
-    ct_free = 0.0          # when the scanner becomes free
-    idle = 0.0             # accumulated idle minutes for the day
-
+def exam_duration(rng, size=None):
+    # Draw CT exam times ~ Normal(12,3) but keep them between 5 and 25 minutes.
+    # Oversample by 30%, keep the in-range draws in order and take as many as
+    # needed; only ~1% are rejected, so the top-up loop almost never runs.
+    n = int(np.prod(size)) if size is not None else 1
+    kept = np.empty(0)
+    while kept.size < n:
+        raw = rng.normal(12, 3, int((n - kept.size) * 1.3) + 1)
+        kept = np.concatenate((kept, raw[(raw >= 5) & (raw <= 25)]))
+    durs = kept[:n]
+    return durs.reshape(size) if size is not None else durs[0]
+
+# -----------------------------
+# Simulate one CT scanner for many days at once
+# -----------------------------
+def simulate_day(delays, durs):
+    # Simulate one CT scanner for a batch of days. `delays` and `durs` have shape
+    # (n_days, EXAMS_PER_DAY_PER_SCANNER); each day is one row.
+    # Returns the total idle minutes for each day.
+    n_days = delays.shape[0]
+    ct_free = np.zeros(n_days)   # when the scanner becomes free, per day
+    idle = np.zeros(n_days)      # accumulated idle minutes, per day
+
+    # Exams depend on each other (ct_free rolls forward), so loop over the exam
+    # index and process every day's exam i together
     for i in range(EXAMS_PER_DAY_PER_SCANNER):
-        sched = i * schedule_interval   # Planned schedule time (0, 60, 120, ..., 660)
-
-        # Draw stochastic components
-        delay = delay_fn()              # transport delay D_i
-        dur   = exam_duration()         # exam duration T_i
-        arrival = sched + delay         # Patient arrival time at CT
-        start = max(arrival, ct_free)   # CT start time = max(arrival, when scanner is free)
-      
-        if start > ct_free:             # Idle time is any gap between ct_free and start
-            idle += (start - ct_free)
-      
-        ct_free = start + dur           # Exam ends after duration
+        sched = SCHED[i]                        # Planned schedule time (0, 60, 120, ..., 660)
+        arrival = sched + delays[:, i]          # Patient arrival time at CT
+        start = np.maximum(arrival, ct_free)    # CT start time = max(arrival, when scanner is free)
+        idle += start - ct_free                 # Idle time is any gap between ct_free and start
+        ct_free = start + durs[:, i]            # Exam ends after duration
 
     return idle
 
-# -----------------------------
-# Run many simulated days and return the average idle minutes
-# -----------------------------
-def run_avg_idle(delay_fn, n_days=N_SIM_DAYS):
-#  Run the single-day simulation n_days times and return the average idle minutes per day per scanner.
-    idles = [simulate_day(delay_fn) for _ in range(n_days)]
-    return statistics.mean(idles)
+if njit is not None:
+    @njit(cache=True)
+    def _sim_one_day(delays, durs, sched_times):
+        # Compiled single-day loop: same arithmetic as simulate_day for one row
+        ct_free = 0.0
+        idle = 0.0
+        for i in range(delays.shape[0]):
+            arrival = sched_times[i] + delays[i]
+            start = arrival if arrival > ct_free else ct_free
+            idle += start - ct_free
+            ct_free = start + durs[i]
+        return idle
+
+    @njit(parallel=True, cache=True)
+    def _simulate_days_jit(delays, durs, sched_times):
+        # Days are independent, so spread them across cores with prange
+        n_days = delays.shape[0]
+        out = np.empty(n_days)
+        for d in prange(n_days):
+            out[d] = _sim_one_day(delays[d], durs[d], sched_times)
+        return out
+
+    def simulate_days(delays, durs):
+        # Numba-compiled replacement for simulate_day (same inputs and output)
+        return _simulate_days_jit(delays, durs, SCHED)
+else:
+    simulate_days = simulate_day
 
 # -----------------------------
-# Compute average idle for each scenario
+# Run many simulated days and return the average idle minutes
 # -----------------------------
-baseline_idle = run_avg_idle(delay_baseline)
-rovex_idle    = run_avg_idle(delay_rovex_transport_uptime)
-workflow_idle = run_avg_idle(delay_rovex_workflow_uptime)
-
-print("Average idle minutes per day per scanner:")
-print(f"  Baseline:              {baseline_idle:.1f} min/day")
-print(f"  6 Rovis – Transport:   {rovex_idle:.1f} min/day")
-print(f"  6 Rovis + Workflow:    {workflow_idle:.1f} min/day")
+def run_avg_idle(delay_fn, n_days=N_SIM_DAYS, rng=RNG):
+    # Draw every day's delays and exam durations in one batch, simulate all days
+    # together and return the average idle minutes per day per scanner.
+    shape = (n_days, EXAMS_PER_DAY_PER_SCANNER)
+    delays = delay_fn(rng, shape)       # transport delay D_i
+    durs = exam_duration(rng, shape)    # exam duration T_i
+    return simulate_days(delays, durs).mean()
 
 # -----------------------------
 # Helper to convert freed minutes -> contribution margin (CM)
@@ -130,35 +161,51 @@ def annual_cm_from_freed(freed_min_per_scanner):
     # Contribution margin
     return booked_hours_year * CT_CM_PER_HOUR
 
-# -----------------------------
-# Build summary table
-# -----------------------------
-rows = []
-
-# Baseline (no freed idle)
-rows.append({
-    "Scenario": "Baseline – Manual Transport",
-    "Freed Idle Min/Day per Scanner": 0.0,
-    "Freed Idle Min/Day (6 CTs)": 0.0,
-    "Monthly Imaging CM (CT)": 0
-})
-
-for name, idle in [
-    ("6 Rovis – Transport Only (80% uptime)", rovex_idle),
-    ("6 Rovis – Transport + Workflow (80% uptime)", workflow_idle)
-]:
-    freed_per_scanner = max(0.0, baseline_idle - idle)      # minutes freed per scanner
-    freed_all = freed_per_scanner * NUM_SCANNERS            # minutes freed across all scanners
-    annual_cm = annual_cm_from_freed(freed_per_scanner)     # dollars per year
-    monthly_cm = annual_cm / 12.0                           # dollars per month
-
+if __name__ == "__main__":
+    # -----------------------------
+    # Compute average idle for each scenario
+    # -----------------------------
+    baseline_idle = run_avg_idle(delay_baseline)
+    rovex_idle    = run_avg_idle(delay_rovex_transport_uptime)
+    workflow_idle = run_avg_idle(delay_rovex_workflow_uptime)
+
+    print("Average idle minutes per day per scanner:")
+    print(f"  Baseline:              {baseline_idle:.1f} min/day")
+    print(f"  6 Rovis – Transport:   {rovex_idle:.1f} min/day")
+    print(f"  6 Rovis + Workflow:    {workflow_idle:.1f} min/day")
+
+    # -----------------------------
+    # Build summary table
+    # -----------------------------
+    rows = []
+
+    # Baseline (no freed idle)
     rows.append({
-        "Scenario": name,
-        "Freed Idle Min/Day per Scanner": round(freed_per_scanner, 1),
-        "Freed Idle Min/Day (6 CTs)": round(freed_all, 1),
-        "Monthly Imaging CM (CT)": round(monthly_cm, 0)
+        "Scenario": "Baseline – Manual Transport",
+        "Freed Idle Min/Day per Scanner": 0.0,
+        "Freed Idle Min/Day (6 CTs)": 0.0,
+        "Monthly Imaging CM (CT)": 0.0
     })
 
-summary_df = pd.DataFrame(rows)
-print("\nOutput Summary Table:")
-print(summary_df.to_string(index=False))
+    for name, idle in [
+        ("6 Rovis – Transport Only (80% uptime)", rovex_idle),
+        ("6 Rovis – Transport + Workflow (80% uptime)", workflow_idle)
+    ]:
+        freed_per_scanner = max(0.0, baseline_idle - idle)      # minutes freed per scanner
+        freed_all = freed_per_scanner * NUM_SCANNERS            # minutes freed across all scanners
+        annual_cm = annual_cm_from_freed(freed_per_scanner)     # dollars per year
+        monthly_cm = annual_cm / 12.0                           # dollars per month
+
+        rows.append({
+            "Scenario": name,
+            "Freed Idle Min/Day per Scanner": freed_per_scanner,
+            "Freed Idle Min/Day (6 CTs)": freed_all,
+            "Monthly Imaging CM (CT)": monthly_cm
+        })
+
+    # Rounding is done by the format specifiers
+    print("\nOutput Summary Table:")
+    print(f"{'Scenario':<45} {'Freed Idle Min/Day per Scanner':>30} {'Freed Idle Min/Day (6 CTs)':>26} {'Monthly Imaging CM (CT)':>23}")
+    for r in rows:
+        print(f"{r['Scenario']:<45} {r['Freed Idle Min/Day per Scanner']:>30.1f} "
+              f"{r['Freed Idle Min/Day (6 CTs)']:>26.1f} {r['Monthly Imaging CM (CT)']:>23.0f}")
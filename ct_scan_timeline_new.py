@@ -1,48 +1,20 @@
+import os
+
+import matplotlib
+
+# Set HEADLESS=1 to skip the GUI and save the figures to PDF instead
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
-plt.close('all')  # close any open figures
-
 # =============================================================================
 # ORIGINAL DETAILED VERSION - All 8 individual steps
 # =============================================================================
 
-# Data — updated to match the workflow table with corrected 75% B3 reduction
-# Format: [Scenario, Step, Start, Duration]
-ct_data = [
-    # Baseline
-    ['Baseline', 'P. CT ordered → CT scheduled',        0.0, 27.4],
-    ['Baseline', 'A. CT scheduled → Transport request', 27.4, 52.0],
-    ['Baseline', 'B1. Request → Assigned',              79.4, 11.8],
-    ['Baseline', 'B2. Assigned → Acknowledged',         91.2, 3.8],
-    ['Baseline', 'B3. Acknowledged → Pickup',           95.0, 6.5],
-    ['Baseline', 'C1. Transport start → end',           101.5, 5.0],
-    ['Baseline', 'C2. Transport end → CT start',        106.5, 1.6],
-    ['Baseline', 'C3. CT start → CT end',               108.1, 12.1],
-
-    # Rovis Only
-    ['Rovis Only', 'P. CT ordered → CT scheduled',        0.0, 27.4],
-    ['Rovis Only', 'A. CT scheduled → Transport request', 27.4, 52.0],
-    ['Rovis Only', 'B1. Request → Assigned',              79.4, 3.0],
-    ['Rovis Only', 'B2. Assigned → Acknowledged',         82.4, 1.0],
-    ['Rovis Only', 'B3. Acknowledged → Pickup',           83.4, 1.6],
-    ['Rovis Only', 'C1. Transport start → end',           85.0, 5.0],
-    ['Rovis Only', 'C2. Transport end → CT start',        90.0, 1.6],
-    ['Rovis Only', 'C3. CT start → CT end',               91.6, 12.1],
-
-    # Rovis + Workflow Redesign
-    ['Rovis + Workflow Redesign', 'P. CT ordered → CT scheduled',        0.0, 27.4],
-    ['Rovis + Workflow Redesign', 'A. CT scheduled → Transport request', 27.4, 35.0],
-    ['Rovis + Workflow Redesign', 'B1. Request → Assigned',              62.4, 3.0],
-    ['Rovis + Workflow Redesign', 'B2. Assigned → Acknowledged',         65.4, 1.0],
-    ['Rovis + Workflow Redesign', 'B3. Acknowledged → Pickup',           66.4, 1.6],
-    ['Rovis + Workflow Redesign', 'C1. Transport start → end',           68.0, 5.0],
-    ['Rovis + Workflow Redesign', 'C2. Transport end → CT start',        73.0, 1.6],
-    ['Rovis + Workflow Redesign', 'C3. CT start → CT end',               74.6, 12.1],
-]
-
-ct_df = pd.DataFrame(ct_data, columns=['Scenario', 'Step', 'Start', 'Duration'])
-
 # Order steps top-to-bottom on the chart
 step_order_internal = [
     'P. CT ordered → CT scheduled',
@@ -55,8 +27,22 @@ step_order_internal = [
     'C3. CT start → CT end',
 ]
 
-# Map each step to a y-position
-y_positions = {step: i for i, step in enumerate(step_order_internal[::-1])}
+# Data — updated to match the workflow table with corrected 75% B3 reduction
+# Built column by column: every scenario lists its steps in step_order_internal order
+ct_df = pd.DataFrame({
+    'Scenario': ['Baseline'] * 8 + ['Rovis Only'] * 8 + ['Rovis + Workflow Redesign'] * 8,
+    'Step': pd.Categorical(step_order_internal * 3, categories=step_order_internal, ordered=True),
+    'Start': np.array([
+        0.0, 27.4, 79.4, 91.2, 95.0, 101.5, 106.5, 108.1,  # Baseline
+        0.0, 27.4, 79.4, 82.4, 83.4, 85.0, 90.0, 91.6,     # Rovis Only
+        0.0, 27.4, 62.4, 65.4, 66.4, 68.0, 73.0, 74.6,     # Rovis + Workflow Redesign
+    ], dtype=np.float32),
+    'Duration': np.array([
+        27.4, 52.0, 11.8, 3.8, 6.5, 5.0, 1.6, 12.1,        # Baseline
+        27.4, 52.0, 3.0, 1.0, 1.6, 5.0, 1.6, 12.1,         # Rovis Only
+        27.4, 35.0, 3.0, 1.0, 1.6, 5.0, 1.6, 12.1,         # Rovis + Workflow Redesign
+    ], dtype=np.float32),
+})
 
 scenarios = ['Baseline', 'Rovis Only', 'Rovis + Workflow Redesign']
 colors = {
@@ -72,7 +58,10 @@ hatches = {
 
 bar_height = 0.35
 
-# Vertical offsets for P, A and B steps so they don't overlap
+# Bars shorter than this (minutes) would only read "0 min", so skip their labels
+MIN_LABEL_DUR = 0.5
+
+# Vertical offsets per scenario so bars don't overlap (applied to every step)
 scheduling_offsets = {
     'Baseline':  0.27,
     'Rovis Only': -0.07,
@@ -86,113 +75,10 @@ label_y_offsets = {
     'Rovis + Workflow Redesign': 0.02,
 }
 
-fig1, ax1 = plt.subplots(figsize=(14, 6))
-
-for scen in scenarios:
-    sub = ct_df[ct_df['Scenario'] == scen]
-    for _, row in sub.iterrows():
-        base_y = y_positions[row['Step']]
-        y = base_y
-        height = bar_height
-
-        # Shift P, A, B steps vertically by scenario so they don't overlap
-        if row['Step'] in ['P. CT ordered → CT scheduled',
-                           'A. CT scheduled → Transport request',
-                           'B1. Request → Assigned',
-                           'B2. Assigned → Acknowledged',
-                           'B3. Acknowledged → Pickup',
-                           'C1. Transport start → end',
-                           'C2. Transport end → CT start',
-                           'C3. CT start → CT end']:
-            y = base_y + scheduling_offsets[scen]
-
-        # Draw bar
-        ax1.barh(
-            y=y,
-            left=row['Start'],
-            width=row['Duration'],
-            color=colors[scen],
-            edgecolor='black',
-            hatch=hatches[scen],
-            alpha=0.9,
-            height=height,
-            label=scen,
-        )
-
-        # Add duration labels on bars
-        rounded_dur = int(round(row['Duration']))
-        label_text = str(rounded_dur) + ' min'
-
-        # Place all labels to the right of bar end
-        x_pos = row['Start'] + row['Duration'] + 1.0  # offset to the right
-        label_y = y  # use actual bar y position
-
-        ax1.text(
-            x_pos,
-            label_y,
-            label_text,
-            va='center',
-            ha='left',
-            fontsize=7,
-            color='black',
-        )
-
-# Axes formatting
-yticks = list(y_positions.values())
-yticklabels = step_order_internal[::-1]
-ax1.set_yticks(yticks)
-ax1.set_yticklabels(yticklabels, fontsize=9)
-
-ax1.set_xlabel('Minutes', fontsize=11)
-ax1.set_xlim(left=0, right=135)
-ax1.grid(axis='x', linestyle='--', alpha=0.4)
-
-# Updated title
-ax1.set_title('CT Transport Timeline by Scenario - Detailed View', fontsize=12, fontweight='bold')
-
-# Deduplicate legend entries
-handles, labels = ax1.get_legend_handles_labels()
-by_label = dict(zip(labels, handles))
-# Move legend to bottom left inside the graph area
-ax1.legend(
-    by_label.values(),
-    by_label.keys(),
-    title='Scenario',
-    loc='center left',
-    bbox_to_anchor=(0.12, 0.5),
-    frameon=True,
-)
-
-plt.tight_layout()
-
 # =============================================================================
 # CONDENSED VERSION - Grouped B and C steps
 # =============================================================================
 
-# Condensed data — grouping B1+B2+B3 and C1+C2+C3
-# Format: [Scenario, Step, Start, Duration]
-ct_data_condensed = [
-    # Baseline
-    ['Baseline', 'P. CT ordered → CT scheduled',           0.0, 27.4],
-    ['Baseline', 'A. CT scheduled → Transport request',    27.4, 52.0],
-    ['Baseline', 'B. Transport coordination (B1+B2+B3)',   79.4, 22.1],  # 11.8+3.8+6.5
-    ['Baseline', 'C. Patient movement & scan (C1+C2+C3)',  101.5, 18.7], # 5.0+1.6+12.1
-
-    # Rovis Only
-    ['Rovis Only', 'P. CT ordered → CT scheduled',           0.0, 27.4],
-    ['Rovis Only', 'A. CT scheduled → Transport request',    27.4, 52.0],
-    ['Rovis Only', 'B. Transport coordination (B1+B2+B3)',   79.4, 5.6],  # 3.0+1.0+1.6
-    ['Rovis Only', 'C. Patient movement & scan (C1+C2+C3)',  85.0, 18.7], # 5.0+1.6+12.1
-
-    # Rovis + Workflow Redesign
-    ['Rovis + Workflow Redesign', 'P. CT ordered → CT scheduled',           0.0, 27.4],
-    ['Rovis + Workflow Redesign', 'A. CT scheduled → Transport request',    27.4, 35.0],
-    ['Rovis + Workflow Redesign', 'B. Transport coordination (B1+B2+B3)',   62.4, 5.6],  # 3.0+1.0+1.6
-    ['Rovis + Workflow Redesign', 'C. Patient movement & scan (C1+C2+C3)',  68.0, 18.7], # 5.0+1.6+12.1
-]
-
-ct_df_condensed = pd.DataFrame(ct_data_condensed, columns=['Scenario', 'Step', 'Start', 'Duration'])
-
 # Order steps top-to-bottom on the condensed chart
 step_order_condensed = [
     'P. CT ordered → CT scheduled',
@@ -201,8 +87,22 @@ step_order_condensed = [
     'C. Patient movement & scan (C1+C2+C3)',
 ]
 
-# Map each step to a y-position
-y_positions_condensed = {step: i for i, step in enumerate(step_order_condensed[::-1])}
+# Condensed data — grouping B1+B2+B3 and C1+C2+C3
+# B durations: 11.8+3.8+6.5 (baseline) and 3.0+1.0+1.6 (Rovis); C durations: 5.0+1.6+12.1
+ct_df_condensed = pd.DataFrame({
+    'Scenario': ['Baseline'] * 4 + ['Rovis Only'] * 4 + ['Rovis + Workflow Redesign'] * 4,
+    'Step': pd.Categorical(step_order_condensed * 3, categories=step_order_condensed, ordered=True),
+    'Start': np.array([
+        0.0, 27.4, 79.4, 101.5,  # Baseline
+        0.0, 27.4, 79.4, 85.0,   # Rovis Only
+        0.0, 27.4, 62.4, 68.0,   # Rovis + Workflow Redesign
+    ], dtype=np.float32),
+    'Duration': np.array([
+        27.4, 52.0, 22.1, 18.7,  # Baseline
+        27.4, 52.0, 5.6, 18.7,   # Rovis Only
+        27.4, 35.0, 5.6, 18.7,   # Rovis + Workflow Redesign
+    ], dtype=np.float32),
+})
 
 bar_height_condensed = 0.25
 
@@ -227,75 +127,138 @@ special_offsets = {
     ('Rovis + Workflow Redesign', 'C. Patient movement & scan (C1+C2+C3)'): -0.14,  # Move green C bar down 5 pixels
 }
 
-fig2, ax2 = plt.subplots(figsize=(14, 5))
-
-for scen in scenarios:
-    sub = ct_df_condensed[ct_df_condensed['Scenario'] == scen]
-    for _, row in sub.iterrows():
-        base_y = y_positions_condensed[row['Step']]
-        y = base_y + scheduling_offsets_condensed[scen]
-        
-        # Apply special offset for green A bar
-        if (scen, row['Step']) in special_offsets:
-            y += special_offsets[(scen, row['Step'])]
-        
-        height = bar_height_condensed
-
-        # Draw bar
-        ax2.barh(
+
+# =============================================================================
+# SHARED GANTT PLOTTING
+# =============================================================================
+
+def plot_gantt(df, step_order, offsets, special=None, bar_height=0.35, ax=None,
+               label_fontsize=7, tick_fontsize=9):
+    """Draw one horizontal bar per row of df, one barh call per scenario.
+
+    Steps are placed top-to-bottom in step_order. Each scenario's bars are
+    shifted by offsets[scenario], plus any per-(scenario, step) nudge in
+    special. Returns the axes drawn on.
+    """
+    if ax is None:
+        ax = plt.gca()
+
+    # Map each step to a y-position (first step at the top)
+    y_positions = pd.Series(np.arange(len(step_order) - 1, -1, -1, dtype=np.float32), index=step_order)
+    # Same special offsets indexed by (scenario, step) so each scenario's steps can be looked up at once
+    special_series = pd.Series(special) if special else None
+
+    # Split the rows by scenario in one pass
+    scenario_rows = dict(tuple(df.groupby('Scenario', sort=False)))
+
+    for scen in scenarios:
+        sub = scenario_rows[scen]
+        starts = sub['Start'].to_numpy()
+        durs = sub['Duration'].to_numpy()
+        base_y = sub['Step'].map(y_positions).to_numpy(dtype=np.float32)
+
+        # Shift steps vertically by scenario so they don't overlap
+        y = base_y + offsets[scen]
+
+        # Apply special offsets for individual bars (0 where none is set)
+        if special_series is not None:
+            bar_keys = pd.MultiIndex.from_arrays([sub['Scenario'], sub['Step'].astype(str)])
+            y = y + special_series.reindex(bar_keys, fill_value=0.0).to_numpy()
+
+        # Draw all of this scenario's bars in one call
+        ax.barh(
             y=y,
-            left=row['Start'],
-            width=row['Duration'],
+            left=starts,
+            width=durs,
             color=colors[scen],
             edgecolor='black',
             hatch=hatches[scen],
             alpha=0.9,
-            height=height,
+            height=bar_height,
             label=scen,
+            rasterized=HEADLESS,  # one image layer in the saved PDF instead of vector paths
         )
 
-        # Add duration labels on bars
-        rounded_dur = int(round(row['Duration']))
-        label_text = str(rounded_dur) + ' min'
-
-        # Place labels to the right of bar end
-        x_pos = row['Start'] + row['Duration'] + 1.0
-        label_y = y
-
-        ax2.text(
-            x_pos,
-            label_y,
-            label_text,
-            va='center',
-            ha='left',
-            fontsize=8,
-            color='black',
-        )
-
-# Axes formatting
-yticks_condensed = list(y_positions_condensed.values())
-yticklabels_condensed = step_order_condensed[::-1]
-ax2.set_yticks(yticks_condensed)
-ax2.set_yticklabels(yticklabels_condensed, fontsize=10)
-
-ax2.set_xlabel('Minutes', fontsize=11)
-ax2.set_xlim(left=0, right=130)
-ax2.grid(axis='x', linestyle='--', alpha=0.4)
-
-# Updated title
-ax2.set_title('CT Transport Timeline by Scenario - Condensed View', fontsize=12, fontweight='bold')
-
-# Deduplicate legend entries and move to top right
-handles2, labels2 = ax2.get_legend_handles_labels()
-by_label2 = dict(zip(labels2, handles2))
-ax2.legend(
-    by_label2.values(),
-    by_label2.keys(),
-    title='Scenario',
-    loc='upper right',
-    bbox_to_anchor=(0.98, 0.98),
-    frameon=True,
-)
-
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+        # Add duration labels, placed to the right of each bar end at the bar's y
+        labeled = durs >= MIN_LABEL_DUR
+        label_texts = [str(int(round(dur))) + ' min' for dur in durs[labeled]]
+        for x_pos, label_y, label_text in zip((starts + durs + 1.0)[labeled], y[labeled], label_texts):
+            ax.text(
+                x_pos,
+                label_y,
+                label_text,
+                va='center',
+                ha='left',
+                fontsize=label_fontsize,
+                color='black',
+            )
+
+    # Axes formatting
+    ax.set_yticks(y_positions.to_numpy())
+    ax.set_yticklabels(step_order, fontsize=tick_fontsize)
+    ax.set_xlabel('Minutes', fontsize=11)
+    ax.grid(axis='x', linestyle='--', alpha=0.4)
+
+    return ax
+
+
+if __name__ == '__main__':
+    plt.close('all')  # close any open figures
+
+    # Detailed view - all 8 individual steps
+    fig1, ax1 = plt.subplots(figsize=(14, 6))
+    plot_gantt(
+        ct_df, step_order_internal, scheduling_offsets,
+        bar_height=bar_height, ax=ax1,
+    )
+    ax1.set_xlim(left=0, right=135)
+
+    # Updated title
+    ax1.set_title('CT Transport Timeline by Scenario - Detailed View', fontsize=12, fontweight='bold')
+
+    # Deduplicate legend entries
+    handles, labels = ax1.get_legend_handles_labels()
+    by_label = dict(zip(labels, handles))
+    # Move legend to bottom left inside the graph area
+    ax1.legend(
+        by_label.values(),
+        by_label.keys(),
+        title='Scenario',
+        loc='center left',
+        bbox_to_anchor=(0.12, 0.5),
+        frameon=True,
+    )
+
+    plt.tight_layout()
+    if HEADLESS:
+        fig1.savefig('ct_transport_timeline_detailed.pdf', dpi=150)
+
+    # Condensed view - grouped B and C steps
+    fig2, ax2 = plt.subplots(figsize=(14, 5))
+    plot_gantt(
+        ct_df_condensed, step_order_condensed, scheduling_offsets_condensed,
+        special=special_offsets, bar_height=bar_height_condensed, ax=ax2,
+        label_fontsize=8, tick_fontsize=10,
+    )
+    ax2.set_xlim(left=0, right=130)
+
+    # Updated title
+    ax2.set_title('CT Transport Timeline by Scenario - Condensed View', fontsize=12, fontweight='bold')
+
+    # Deduplicate legend entries and move to top right
+    handles2, labels2 = ax2.get_legend_handles_labels()
+    by_label2 = dict(zip(labels2, handles2))
+    ax2.legend(
+        by_label2.values(),
+        by_label2.keys(),
+        title='Scenario',
+        loc='upper right',
+        bbox_to_anchor=(0.98, 0.98),
+        frameon=True,
+    )
+
+    plt.tight_layout()
+    if HEADLESS:
+        fig2.savefig('ct_transport_timeline_condensed.pdf', dpi=150)
+    else:
+        plt.show()
@@ -3,6 +3,15 @@ Standalone visualization for CT scanner activity (baseline scenario).
 Uses the same simulation logic from ct_scan_shands_des_WIP.py but keeps plotting separate.
 """
 
+import os
+
+import matplotlib
+
+# Set HEADLESS=1 to skip the GUI and save the figure to PDF instead
+HEADLESS = bool(os.environ.get("HEADLESS"))
+if HEADLESS:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 
@@ -15,11 +24,23 @@ from ct_scan_shands_des_WIP import (
     NUM_ROBOTS,
 )
 
+try:
+    from joblib import Memory
+except ImportError:  # joblib is optional; without it every run re-simulates
+    Memory = None
 
-def plot_scenario_day(scenario_key, scenario_label):
+if Memory is not None:
+    # Persist simulation results on disk so re-running the script to tweak the
+    # plots skips the Monte Carlo runs (delete .cache_ct after changing the model)
+    _memory = Memory(".cache_ct", verbose=0)
+    run_many_simulations = _memory.cache(run_many_simulations)
+    simulate_one_day = _memory.cache(simulate_one_day)
+
+
+def plot_scenario_day(ax, scenario_key, scenario_label):
     """
-    Run one scenario day, plot first 24h, and show stats from Table 1 (averages)
-    plus robot utilization.
+    Run one scenario day, plot first 24h on `ax`, and show stats from Table 1
+    (averages) plus robot utilization. Returns False if there was nothing to plot.
     """
     # Averages that match Table 1
     _, _, avg_idle, _, avg_completed_scans = run_many_simulations(scenario_key)
@@ -38,7 +59,7 @@ def plot_scenario_day(scenario_key, scenario_label):
     events = [e for e in day.get("scanner_events", []) if e.get("start", 0) < DAY_LENGTH_MIN]
     if not events:
         print(f"No events to plot for {scenario_label}.")
-        return
+        return False
 
     plot_end = DAY_LENGTH_MIN  # 24h window
 
@@ -49,40 +70,38 @@ def plot_scenario_day(scenario_key, scenario_label):
     for evts in events_by_scanner.values():
         evts.sort(key=lambda e: e["start"])
 
-    fig, ax = plt.subplots(figsize=(14, 8))
     bar_height = 0.8
 
     for scanner_idx in range(NUM_SCANNERS):
         y = scanner_idx
-        ax.barh(
-            y,
-            plot_end,
-            left=0,
-            height=bar_height,
-            color="lightcoral",
+        y_range = (y - bar_height / 2, bar_height)
+
+        # Idle background and active exams are one broken_barh each per scanner
+        ax.broken_barh(
+            [(0, plot_end)],
+            y_range,
+            facecolors="lightcoral",
             alpha=0.25,
             edgecolor="none",
+            rasterized=HEADLESS,  # one image layer in the saved PDF instead of vector paths
         )
-        for evt in events_by_scanner.get(scanner_idx, []):
-            if evt["start"] >= plot_end:
-                continue
-            start = evt["start"]
-            end = min(evt["end"], plot_end)
-            duration = end - start
-            if duration <= 0:
-                continue
-            ax.barh(
-                y,
-                duration,
-                left=start,
-                height=bar_height,
-                color="mediumseagreen",
-                edgecolor="none",
-            )
+        active = [
+            (evt["start"], min(evt["end"], plot_end) - evt["start"], evt["patient_id"])
+            for evt in events_by_scanner.get(scanner_idx, [])
+            if evt["start"] < plot_end and min(evt["end"], plot_end) > evt["start"]
+        ]
+        ax.broken_barh(
+            [(start, duration) for start, duration, _ in active],
+            y_range,
+            facecolors="mediumseagreen",
+            edgecolor="none",
+            rasterized=HEADLESS,
+        )
+        for start, duration, patient_id in active:
             ax.text(
                 start + duration / 2,
                 y,
-                f"P{evt['patient_id']}",
+                f"P{patient_id}",
                 ha="center",
                 va="center",
                 fontsize=8,
@@ -128,20 +147,22 @@ def plot_scenario_day(scenario_key, scenario_label):
         verticalalignment="top",
     )
 
-    plt.tight_layout()
-    return fig
+    return True
 
 
 if __name__ == "__main__":
-    figs = []
-    for key, label in [
+    scenarios = [
         ("baseline", "Baseline (Manual Transport)"),
         ("rovis_only", "9 Rovis - Transport Only"),
         ("rovis_workflow", "9 Rovis - Transport + Workflow"),
-    ]:
-        fig = plot_scenario_day(key, label)
-        if fig:
-            figs.append(fig)
-    if figs:
-        # Show and block so windows stay open until you close them
-        plt.show()
+    ]
+    # One figure with a row per scenario, sharing the 24h time axis
+    fig, axes = plt.subplots(len(scenarios), 1, figsize=(14, 24), sharex=True)
+    plotted = [plot_scenario_day(ax, key, label) for ax, (key, label) in zip(axes, scenarios)]
+    if any(plotted):
+        plt.tight_layout()
+        if HEADLESS:
+            fig.savefig("ct_scanner_activity.pdf", dpi=150)
+        else:
+            # Show and block so the window stays open until you close it
+            plt.show()
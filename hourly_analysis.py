@@ -1,13 +1,28 @@
 import math
-import random
 import statistics
 import simpy
+import numpy as np
 
 # Same configuration as main simulation
 NUM_SCANNERS = 6
 NUM_ROBOTS = 9
 DAY_LENGTH_MIN = 24 * 60
-random.seed(42)
+RNG = np.random.default_rng(42)  # single seeded NumPy generator for all random draws
+
+# Base patient arrivals per hour of day (before any robot efficiency scaling)
+BASE_HOURLY_ARRIVALS = np.array([
+    9.0 if 7 <= hour < 19        # 7am-7pm: Busy daytime period
+    else 4.5 if 19 <= hour < 23  # 7pm-11pm: Evening period
+    else 2.5                     # 11pm-7am: Overnight period
+    for hour in range(24)
+], dtype=np.float32)
+
+# Average patient transport time (minutes) per scenario, float32 like the arrival arrays
+TRANSPORT_TIME = {
+    'baseline': np.float32(73.8),        # Average baseline transport time
+    'rovis_only': np.float32(57.5),      # Average with robots
+    'rovis_workflow': np.float32(40.2),  # Average with robots + workflow
+}
 
 def generate_patient_arrivals_with_hourly_tracking(scenario_name='baseline'):
     """
@@ -24,41 +39,18 @@ def generate_patient_arrivals_with_hourly_tracking(scenario_name='baseline'):
     else:
         efficiency_multiplier = 1.0  # Baseline
     
-    arrival_times = []
-    hourly_arrivals = [0] * 24  # Track arrivals per hour
-    
-    for hour in range(24):
-        if 7 <= hour < 19:  # 7am-7pm: Busy daytime period
-            base_arrivals_this_hour = 9.0
-        elif 19 <= hour < 23:  # 7pm-11pm: Evening period  
-            base_arrivals_this_hour = 4.5
-        else:  # 11pm-7am: Overnight period
-            base_arrivals_this_hour = 2.5
-            
-        # Scale arrivals based on robot efficiency
-        arrivals_this_hour = base_arrivals_this_hour * efficiency_multiplier
-            
-        # Generate arrivals for this hour using Poisson process
-        hour_start_min = hour * 60
-        hour_end_min = (hour + 1) * 60
-        current_time = hour_start_min
-        hour_count = 0
-        
-        while current_time < hour_end_min:
-            if arrivals_this_hour > 0:
-                avg_inter_arrival_min = 60.0 / arrivals_this_hour
-                inter_arrival_time = random.expovariate(1.0 / avg_inter_arrival_min)
-                current_time += inter_arrival_time
-                
-                if current_time < hour_end_min:
-                    arrival_times.append(current_time)
-                    hour_count += 1
-            else:
-                break
-        
-        hourly_arrivals[hour] = hour_count
+    # Scale arrivals based on robot efficiency
+    arrivals_per_hour = BASE_HOURLY_ARRIVALS * np.float32(efficiency_multiplier)
+
+    # Poisson process per hour: draw how many patients arrive in each hour, then
+    # place them uniformly within their hour (same distribution as chaining
+    # exponential inter-arrival gaps) and sort once
+    hourly_arrivals = RNG.poisson(arrivals_per_hour)
+    hour_of_arrival = np.repeat(np.arange(24), hourly_arrivals)
+    arrival_times = hour_of_arrival * 60 + RNG.uniform(0, 60, hour_of_arrival.size)
+    arrival_times = np.sort(arrival_times.astype(np.float32, copy=False))
     
-    return arrival_times, hourly_arrivals
+    return arrival_times.tolist(), hourly_arrivals.tolist()
 
 def simulate_hourly_scanner_usage(scenario_name='baseline'):
     """
@@ -69,74 +61,70 @@ def simulate_hourly_scanner_usage(scenario_name='baseline'):
     
     # For simplicity, assume each scan takes 12 minutes average
     # and starts roughly when patient arrives (ignoring queuing for this analysis)
-    hourly_completions = [0] * 24
+    # Add transport time (varies by scenario)
+    transport_time = TRANSPORT_TIME[scenario_name]
     
-    for arrival_time in arrival_times:
-        # Add transport time (varies by scenario)
-        if scenario_name == 'baseline':
-            transport_time = 73.8  # Average baseline transport time
-        elif scenario_name == 'rovis_only':
-            transport_time = 57.5  # Average with robots
-        else:  # rovis_workflow
-            transport_time = 40.2  # Average with robots + workflow
-        
-        # Add scan time (12 minutes average)
-        scan_completion_time = arrival_time + transport_time + 12
-        
-        # Determine which hour the scan completes
-        completion_hour = int(scan_completion_time // 60)
-        if completion_hour < 24:  # Only count scans that complete same day
-            hourly_completions[completion_hour] += 1
+    # Add scan time (12 minutes average) and count completions per hour
+    scan_completion_times = np.asarray(arrival_times, dtype=np.float32) + transport_time + np.float32(12)
+    completion_hours = (scan_completion_times // 60).astype(int)
+    same_day = completion_hours < 24  # Only count scans that complete same day
+    hourly_completions = np.bincount(completion_hours[same_day], minlength=24).tolist()
     
     return hourly_arrivals, hourly_completions
 
-# Analyze all three scenarios
-scenarios = [
-    ('baseline', 'Baseline - Manual Transport'),
-    ('rovis_only', '9 Rovis - Transport Only'),
-    ('rovis_workflow', '9 Rovis - Transport + Workflow')
-]
+def main():
+    """Print the hourly arrival/completion table for every scenario."""
+    # Analyze all three scenarios
+    scenarios = [
+        ('baseline', 'Baseline - Manual Transport'),
+        ('rovis_only', '9 Rovis - Transport Only'),
+        ('rovis_workflow', '9 Rovis - Transport + Workflow')
+    ]
 
-print("\nHOURLY CT SCAN ANALYSIS")
-print("="*80)
-print("Shows patient arrivals and scan completions by hour over 24 hours")
-print("="*80)
+    print("\nHOURLY CT SCAN ANALYSIS")
+    print("="*80)
+    print("Shows patient arrivals and scan completions by hour over 24 hours")
+    print("="*80)
 
-for scenario_key, scenario_label in scenarios:
-    arrivals, completions = simulate_hourly_scanner_usage(scenario_key)
+    for scenario_key, scenario_label in scenarios:
+        arrivals, completions = simulate_hourly_scanner_usage(scenario_key)
     
-    print(f"\n{scenario_label}:")
-    print(f"{'Hour':<6} {'Arrivals':<10} {'Completions':<12} {'Per Scanner':<12}")
-    print("-" * 50)
+        print(f"\n{scenario_label}:")
+        print(f"{'Hour':<6} {'Arrivals':<10} {'Completions':<12} {'Per Scanner':<12}")
+        print("-" * 50)
     
-    total_arrivals = 0
-    total_completions = 0
+        total_arrivals = 0
+        total_completions = 0
     
-    for hour in range(24):
-        per_scanner = completions[hour] / NUM_SCANNERS
-        total_arrivals += arrivals[hour]
-        total_completions += completions[hour]
+        for hour in range(24):
+            per_scanner = completions[hour] / NUM_SCANNERS
+            total_arrivals += arrivals[hour]
+            total_completions += completions[hour]
         
-        # Format hour as time
-        if hour == 0:
-            time_str = "12am"
-        elif hour < 12:
-            time_str = f"{hour}am"
-        elif hour == 12:
-            time_str = "12pm"
-        else:
-            time_str = f"{hour-12}pm"
+            # Format hour as time
+            if hour == 0:
+                time_str = "12am"
+            elif hour < 12:
+                time_str = f"{hour}am"
+            elif hour == 12:
+                time_str = "12pm"
+            else:
+                time_str = f"{hour-12}pm"
             
-        print(f"{time_str:<6} {arrivals[hour]:<10} {completions[hour]:<12} {per_scanner:.1f}")
+            print(f"{time_str:<6} {arrivals[hour]:<10} {completions[hour]:<12} {per_scanner:.1f}")
     
-    print("-" * 50)
-    print(f"Total: {total_arrivals:<10} {total_completions:<12} {total_completions/NUM_SCANNERS:.1f}/day")
-    print(f"Average per hour: {total_completions/24:.1f} total ({total_completions/24/NUM_SCANNERS:.1f} per scanner)")
+        print("-" * 50)
+        print(f"Total: {total_arrivals:<10} {total_completions:<12} {total_completions/NUM_SCANNERS:.1f}/day")
+        print(f"Average per hour: {total_completions/24:.1f} total ({total_completions/24/NUM_SCANNERS:.1f} per scanner)")
+
+    print("\n" + "="*80)
+    print("OBSERVATIONS:")
+    print("- Peak hours: 7am-7pm (daytime)")
+    print("- Each scanner averages 1-2 scans during busy hours")
+    print("- Overnight hours (11pm-7am) have 0-1 scans per scanner")
+    print("- Robots enable higher throughput during all hours")
+    print("="*80)
+
 
-print("\n" + "="*80)
-print("OBSERVATIONS:")
-print("- Peak hours: 7am-7pm (daytime)")
-print("- Each scanner averages 1-2 scans during busy hours")
-print("- Overnight hours (11pm-7am) have 0-1 scans per scanner")
-print("- Robots enable higher throughput during all hours")
-print("="*80)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,104 @@
-import math
-import random
-import statistics
 import simpy
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy transport_totals below is used without it
+    njit = None
 
 # Import the functions from the main simulation
 import sys
 sys.path.append('.')
 from ct_scan_shands_des import (
-    generate_patient_arrivals, NUM_SCANNERS, NUM_ROBOTS, 
-    DAY_LENGTH_MIN, STEP_MEANS, STEP_SIGMA, STEP_ORDER,
-    get_step_duration, generate_exam_duration, calculate_transport_time
+    NUM_SCANNERS, NUM_ROBOTS, 
+    DAY_LENGTH_MIN, STEP_MEANS, STEP_SIGMA, ROBOT_UPTIME
 )
+from ct_scan_arrivals import generate_patient_arrivals
+
+SEED = 42
+
+# Steps that make up the patient transport time (A + B1 + B2 + B3 + C1 + C2)
+TRANSPORT_STEPS = ['A', 'B1', 'B2', 'B3', 'C1', 'C2']
 
-random.seed(42)
+# One record per patient (indexed by patient_id) for the timing of their scan
+EVENT_DTYPE = np.dtype([
+    ('sched', 'f8'),        # scheduled time
+    ('arrived', 'f8'),      # arrived at CT
+    ('scan_start', 'f8'),
+    ('scan_end', 'f8'),
+    ('start_hr', 'i4'),
+    ('end_hr', 'i4'),
+    ('done', '?'),          # scan started and its end time recorded
+])
 
-def simulate_one_patient_with_timing(env, patient_id, scheduled_time, scanners, robots, 
-                                   scenario_name, scanner_events):
+
+def transport_lognormal_params(scenario_name):
     """
-    Simulate one patient and track detailed timing for hourly analysis.
+    Log-normal (mu, sigma) arrays for the transport steps of a scenario,
+    chosen so each step averages to its STEP_MEANS value.
     """
-    # STEP 1: Wait until scheduled time
-    yield env.timeout(scheduled_time)
+    means = np.array([STEP_MEANS[step][scenario_name] for step in TRANSPORT_STEPS])
+    sigmas = np.array([STEP_SIGMA.get(step, 0.3) for step in TRANSPORT_STEPS])
+    return np.log(means) - 0.5 * sigmas**2, sigmas
+
+
+if njit is not None:
+    @njit(cache=True)
+    def transport_totals(robot_up, z, mus, sigmas, base_mus, base_sigmas):
+        # Compiled per-patient sum of the lognormal transport steps, using the
+        # scenario's steps when the robot is up and baseline steps when it is down
+        n_patients, n_steps = z.shape
+        transport_times = np.empty(n_patients)
+        for i in range(n_patients):
+            step_mus = mus if robot_up[i] else base_mus
+            step_sigmas = sigmas if robot_up[i] else base_sigmas
+            total = 0.0
+            for k in range(n_steps):
+                total += np.exp(step_mus[k] + step_sigmas[k] * z[i, k])
+            transport_times[i] = total
+        return transport_times
+else:
+    def transport_totals(robot_up, z, mus, sigmas, base_mus, base_sigmas):
+        # Per-patient sum of the lognormal transport steps, using the scenario's
+        # steps when the robot is up and baseline steps when it is down
+        step_mus = np.where(robot_up[:, None], mus, base_mus)
+        step_sigmas = np.where(robot_up[:, None], sigmas, base_sigmas)
+        return np.exp(step_mus + step_sigmas * z).sum(axis=1)
+
+
+def predraw(n_patients, seed, scenario_name):
+    """
+    Draw every patient's transport time and exam time for one simulated day
+    before the SimPy processes start.
+
+    Each patient's robot is up with probability ROBOT_UPTIME; when it is down
+    the patient falls back to baseline transport, so the uptime mix is already
+    in transport_times. All draws come from np.random.default_rng(seed), so a
+    seed gives the same day with or without Numba. Returns two arrays of
+    length n_patients.
+    """
+    mus, sigmas = transport_lognormal_params(scenario_name)
+    base_mus, base_sigmas = transport_lognormal_params('baseline')
+
+    rng = np.random.default_rng(seed)
+    robot_up = rng.random(n_patients) < ROBOT_UPTIME
+    z = rng.standard_normal((n_patients, len(TRANSPORT_STEPS)))
+    transport_times = transport_totals(robot_up, z, mus, sigmas, base_mus, base_sigmas)
+
+    # Exam duration ~ Normal(12, 3), kept between 5 and 25 minutes (redraw the rest)
+    exam_times = rng.normal(12, 3, n_patients)
+    bad = (exam_times < 5) | (exam_times > 25)
+    while bad.any():
+        exam_times[bad] = rng.normal(12, 3, int(bad.sum()))
+        bad = (exam_times < 5) | (exam_times > 25)
+    return transport_times, exam_times
 
-    # STEP 2: Transport patient to CT area
-    if scenario_name == "baseline":
-        transport_time = calculate_transport_time('baseline')
-        yield env.timeout(transport_time)
-    else:
-        time_when_robot_requested = env.now
-        with robots.request() as robot_request:
-            yield robot_request
-            time_when_robot_available = env.now
-            
-            # 80% uptime for robots
-            if random.random() < 0.80:
-                transport_time = calculate_transport_time(scenario_name)
-            else:
-                transport_time = calculate_transport_time('baseline')
-            yield env.timeout(transport_time)
 
+def _scan_with_timing(env, patient_id, scheduled_time, scanners, exam_time, events):
+    """
+    Shared tail of both patient generators: queue for a CT scanner, record the
+    patient's timing in events[patient_id] and perform the exam.
+    """
     # STEP 3: Request CT scanner
     time_when_ct_requested = env.now
     with scanners.request() as scanner_request:
@@ -46,84 +106,132 @@ def simulate_one_patient_with_timing(env, patient_id, scheduled_time, scanners,
         time_when_ct_starts = env.now
         
         # Record detailed timing
-        scanner_events.append({
-            'patient_id': patient_id,
-            'scheduled': scheduled_time,
-            'arrived_ct': time_when_ct_requested,
-            'scan_start': time_when_ct_starts,
-            'scan_start_hour': int(time_when_ct_starts // 60)
-        })
+        events['sched'][patient_id] = scheduled_time
+        events['arrived'][patient_id] = time_when_ct_requested
+        events['scan_start'][patient_id] = time_when_ct_starts
+        events['start_hr'][patient_id] = int(time_when_ct_starts // 60)
         
         # STEP 4: Perform CT exam
-        exam_time = generate_exam_duration()
-        scanner_events[-1]['scan_end'] = time_when_ct_starts + exam_time
-        scanner_events[-1]['scan_end_hour'] = int((time_when_ct_starts + exam_time) // 60)
+        events['scan_end'][patient_id] = time_when_ct_starts + exam_time
+        events['end_hr'][patient_id] = int((time_when_ct_starts + exam_time) // 60)
+        events['done'][patient_id] = True
         yield env.timeout(exam_time)
 
 
-def analyze_hourly_patterns(scenario_name):
+def _baseline_patient_gen(env, patient_id, scheduled_time, scanners, robots,
+                          transport_time, exam_time, events):
     """
-    Analyze when additional scans occur throughout the day.
+    Simulate one baseline patient (manual transport, no robot pool) and track
+    detailed timing for hourly analysis. robots is unused; it keeps the
+    signature the same as _rovis_patient_gen.
+    """
+    # STEP 1: Wait until scheduled time
+    yield env.timeout(scheduled_time)
+
+    # STEP 2: Transport patient to CT area
+    yield env.timeout(transport_time)
+
+    yield from _scan_with_timing(env, patient_id, scheduled_time, scanners, exam_time, events)
+
+
+def _rovis_patient_gen(env, patient_id, scheduled_time, scanners, robots,
+                       transport_time, exam_time, events):
+    """
+    Simulate one patient transported by a robot from the robots pool and track
+    detailed timing for hourly analysis. transport_time and exam_time are this
+    patient's pre-drawn durations; timings are written to events[patient_id].
+    """
+    # STEP 1: Wait until scheduled time
+    yield env.timeout(scheduled_time)
+
+    # STEP 2: Transport patient to CT area
+    with robots.request() as robot_request:
+        yield robot_request
+        
+        # 80% uptime for robots is already folded into transport_time
+        yield env.timeout(transport_time)
+
+    yield from _scan_with_timing(env, patient_id, scheduled_time, scanners, exam_time, events)
+
+
+def schedule_scenario(env, scenario_name):
+    """
+    Create one scenario's scanner (and robot) pools in env and start a process
+    per patient. Returns (arrival_times, events); events fill in as env runs.
     """
-    print(f"\nHOURLY SCAN ANALYSIS - {scenario_name.upper()}")
-    print("=" * 60)
-    
-    # Set up simulation
-    env = simpy.Environment()
     scanners = simpy.Resource(env, capacity=NUM_SCANNERS)
     robots = None if scenario_name == "baseline" else simpy.Resource(env, capacity=NUM_ROBOTS)
     
-    scanner_events = []
-    
-    # Generate patient arrivals
-    arrival_times = generate_patient_arrivals(scenario_name)
+    # Generate patient arrivals (seeded, so they don't depend on what was simulated before)
+    arrival_times = generate_patient_arrivals(scenario_name, SEED)
+    events = np.zeros(len(arrival_times), dtype=EVENT_DTYPE)
+
+    # Draw every patient's transport and exam times in one batch
+    transport_times, exam_times = predraw(len(arrival_times), SEED, scenario_name)
     
-    # Schedule all patients
+    # Schedule all patients, with the generator picked once for the scenario
+    patient_gen = _baseline_patient_gen if robots is None else _rovis_patient_gen
     for patient_id, arrival_time in enumerate(arrival_times):
-        env.process(simulate_one_patient_with_timing(
+        env.process(patient_gen(
             env, patient_id, arrival_time, scanners, robots,
-            scenario_name, scanner_events
+            transport_times[patient_id], exam_times[patient_id], events
         ))
-    
-    # Run simulation
-    env.run(until=DAY_LENGTH_MIN + 240)
-    
+
+    return arrival_times, events
+
+
+def tally_hourly(arrival_times, events):
+    """
+    Hourly scan and arrival counts for one finished scenario run.
+    """
     # Filter completed scans
-    completed_scans = [e for e in scanner_events if 'scan_end' in e]
+    completed_scans = events[events['done']]
     
-    # Count scans by hour
-    hourly_scans = {}
-    hourly_arrivals = {}
-    
-    for hour in range(24):
-        hourly_scans[hour] = 0
-        hourly_arrivals[hour] = 0
-    
-    # Count arrivals by hour
-    for arrival_time in arrival_times:
-        hour = int(arrival_time // 60)
-        if hour < 24:
-            hourly_arrivals[hour] += 1
+    # Count arrivals by hour (hours past midnight fall outside the day)
+    arrival_hours = (np.asarray(arrival_times) // 60).astype(np.int64)
+    hourly_arrivals = np.bincount(arrival_hours[arrival_hours < 24], minlength=24)
     
     # Count completed scans by start hour
-    for scan in completed_scans:
-        hour = scan['scan_start_hour']
-        if hour < 24:
-            hourly_scans[hour] += 1
+    start_hours = completed_scans['start_hr']
+    hourly_scans = np.bincount(start_hours[start_hours < 24], minlength=24)
     
     return hourly_scans, hourly_arrivals, len(completed_scans), len(arrival_times)
 
 
+def analyze_hourly_patterns(scenario_name):
+    """
+    Analyze when additional scans occur throughout the day.
+    """
+    env = simpy.Environment()
+    arrival_times, events = schedule_scenario(env, scenario_name)
+    env.run(until=DAY_LENGTH_MIN + 240)
+    return tally_hourly(arrival_times, events)
+
+
+def analyze_both_scenarios():
+    """
+    Simulate baseline and rovis_only in a single SimPy environment.
+    Each scenario has its own scanner/robot pools and event buffer, so they
+    don't interact, and both draw exam and transport times from the same SEED.
+    Returns {scenario_name: analyze_hourly_patterns-style result}.
+    """
+    env = simpy.Environment()
+    runs = {name: schedule_scenario(env, name) for name in ("baseline", "rovis_only")}
+    env.run(until=DAY_LENGTH_MIN + 240)
+    return {name: tally_hourly(*run) for name, run in runs.items()}
+
+
 def compare_hourly_patterns():
     """
     Compare baseline vs rovis_only to see when additional scans occur.
     """
     print("HOURLY PATTERN ANALYSIS: WHERE DO THE ADDITIONAL 3.9 SCANS OCCUR?")
     print("=" * 80)
-    
-    # Run both scenarios
-    baseline_scans, baseline_arrivals, baseline_total, baseline_arrivals_total = analyze_hourly_patterns("baseline")
-    rovis_scans, rovis_arrivals, rovis_total, rovis_arrivals_total = analyze_hourly_patterns("rovis_only")
+
+    # Run both scenarios in one environment
+    results = analyze_both_scenarios()
+    baseline_scans, baseline_arrivals, baseline_total, baseline_arrivals_total = results["baseline"]
+    rovis_scans, rovis_arrivals, rovis_total, rovis_arrivals_total = results["rovis_only"]
     
     print(f"\nSUMMARY:")
     print(f"Baseline total scans: {baseline_total}")
@@ -152,7 +260,7 @@ def compare_hourly_patterns():
               f"{additional_scans:+3d} {'(+' + str(additional_arrivals) + ' arr)':<12}")
     
     print("-" * 70)
-    print(f"{'TOTAL':<19} {sum(baseline_scans.values()):<10} {sum(rovis_scans.values()):<8} {total_additional:+3d}")
+    print(f"{'TOTAL':<19} {baseline_scans.sum():<10} {rovis_scans.sum():<8} {total_additional:+3d}")
     
     # Period summaries
     periods = {
@@ -166,8 +274,8 @@ def compare_hourly_patterns():
     print("-" * 70)
     
     for period_name, hours in periods.items():
-        baseline_period = sum(baseline_scans[h] for h in hours)
-        rovis_period = sum(rovis_scans[h] for h in hours)
+        baseline_period = baseline_scans[hours].sum()
+        rovis_period = rovis_scans[hours].sum()
         additional_period = rovis_period - baseline_period
         pct_of_additional = (additional_period / total_additional * 100) if total_additional > 0 else 0
         
@@ -176,4 +284,11 @@ def compare_hourly_patterns():
 
 
 if __name__ == "__main__":
-    compare_hourly_patterns()
\ No newline at end of file
+    if '--profile' in sys.argv:
+        # Profile the run and print the 20 most expensive calls (cumulative time) to stderr
+        import cProfile, pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(compare_hourly_patterns)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(20)
+    else:
+        compare_hourly_patterns()
\ No newline at end of file
@@ -1,15 +1,9 @@
-import math
-import random
-import statistics
-import simpy
-
-# Import the functions from the main simulation
 import sys
-sys.path.append('.')
-from ct_scan_shands_des import (
-    generate_patient_arrivals, NUM_SCANNERS, NUM_ROBOTS, 
-    DAY_LENGTH_MIN, simulate_one_day
-)
+import numpy as np
+
+# Period labels and per-hour arrival counts shared with the other hourly table
+from hourly_table_common import NUM_SCANNERS, HOUR_LABELS, PERIOD_LABELS, hourly_arrival_totals
+
 
 def create_hourly_scan_table():
     """
@@ -20,30 +14,10 @@ def create_hourly_scan_table():
     print("Shows when the additional 3.9 scans per scanner occur throughout a 24-hour period")
     print()
     
-    # Set random seed for consistent results
-    random.seed(42)
-    
-    # Analyze arrival patterns across multiple days
-    baseline_hourly_totals = {hour: 0 for hour in range(24)}
-    rovis_hourly_totals = {hour: 0 for hour in range(24)}
-    
+    # Analyze arrival patterns across multiple days (arrival counts per hour of day)
     num_days = 20  # Analyze more days for better stability
     
-    for day in range(num_days):
-        # Generate arrivals for each scenario
-        baseline_arrivals = generate_patient_arrivals('baseline')
-        rovis_arrivals = generate_patient_arrivals('rovis_only')
-        
-        # Count by hour
-        for arrival in baseline_arrivals:
-            hour = int(arrival // 60)
-            if hour < 24:
-                baseline_hourly_totals[hour] += 1
-        
-        for arrival in rovis_arrivals:
-            hour = int(arrival // 60)
-            if hour < 24:
-                rovis_hourly_totals[hour] += 1
+    baseline_hourly_totals, rovis_hourly_totals = hourly_arrival_totals(num_days)
     
     print("DETAILED HOURLY BREAKDOWN (PER SCANNER BASIS)")
     print("-" * 100)
@@ -51,36 +25,26 @@ def create_hourly_scan_table():
     print(f"{'Slot':<8} {'Type':<12} {'Per Scanner':<12} {'Per Scanner':<12} {'Per Scanner':<12} {'Add\'l':<12}")
     print("-" * 100)
     
-    cumulative_additional_per_scanner = 0
-    
-    for hour in range(24):
-        # Determine period type
-        if 7 <= hour < 19:
-            period = "Daytime"
-            period_icon = "🌅"
-        elif 19 <= hour < 23:
-            period = "Evening"
-            period_icon = "🌆"
-        else:
-            period = "Overnight"
-            period_icon = "🌙"
-        
-        # Calculate averages per scanner
-        baseline_avg_per_scanner = (baseline_hourly_totals[hour] / num_days) / NUM_SCANNERS
-        rovis_avg_per_scanner = (rovis_hourly_totals[hour] / num_days) / NUM_SCANNERS
-        additional_per_scanner = rovis_avg_per_scanner - baseline_avg_per_scanner
-        cumulative_additional_per_scanner += additional_per_scanner
-        
-        # Format time
-        time_str = f"{hour:02d}:00"
-        period_with_icon = f"{period_icon} {period}"
-        
-        print(f"{time_str:<8} {period_with_icon:<12} {baseline_avg_per_scanner:<12.2f} {rovis_avg_per_scanner:<12.2f} "
-              f"{additional_per_scanner:+8.2f} {cumulative_additional_per_scanner:+8.2f}")
-    
+    # Per-scanner averages for every hour at once
+    baseline_per_scanner_arr = baseline_hourly_totals / num_days / NUM_SCANNERS
+    rovis_per_scanner_arr = rovis_hourly_totals / num_days / NUM_SCANNERS
+    add_per_scanner = rovis_per_scanner_arr - baseline_per_scanner_arr
+    cumulative_add_per_scanner = np.cumsum(add_per_scanner)
+    
+    # Format all 24 rows, then print them in one call
+    print("\n".join(
+        f"{time_str:<8} {period_with_icon:<12} {baseline_hr:<12.2f} {rovis_hr:<12.2f} "
+        f"{add_hr:+8.2f} {cumulative_hr:+8.2f}"
+        for time_str, period_with_icon, baseline_hr, rovis_hr, add_hr, cumulative_hr in zip(
+            HOUR_LABELS, PERIOD_LABELS, baseline_per_scanner_arr, rovis_per_scanner_arr,
+            add_per_scanner, cumulative_add_per_scanner,
+        )
+    ))
+    
+    cumulative_additional_per_scanner = cumulative_add_per_scanner[-1]
     print("-" * 100)
-    baseline_total_per_scanner = sum(baseline_hourly_totals.values())/num_days/NUM_SCANNERS
-    rovis_total_per_scanner = sum(rovis_hourly_totals.values())/num_days/NUM_SCANNERS
+    baseline_total_per_scanner = baseline_hourly_totals.sum()/num_days/NUM_SCANNERS
+    rovis_total_per_scanner = rovis_hourly_totals.sum()/num_days/NUM_SCANNERS
     print(f"{'TOTAL':<8} {'All Day':<12} {baseline_total_per_scanner:<12.1f} "
           f"{rovis_total_per_scanner:<12.1f} "
           f"{cumulative_additional_per_scanner:+8.1f} {cumulative_additional_per_scanner:+8.1f}")
@@ -101,8 +65,8 @@ def create_hourly_scan_table():
     total_additional_per_scanner_all_periods = 0
     
     for period_name, data in periods.items():
-        baseline_period_per_scanner = sum(baseline_hourly_totals[h] for h in data['hours']) / num_days / NUM_SCANNERS
-        rovis_period_per_scanner = sum(rovis_hourly_totals[h] for h in data['hours']) / num_days / NUM_SCANNERS
+        baseline_period_per_scanner = baseline_hourly_totals[data['hours']].sum() / num_days / NUM_SCANNERS
+        rovis_period_per_scanner = rovis_hourly_totals[data['hours']].sum() / num_days / NUM_SCANNERS
         additional_per_scanner_period = rovis_period_per_scanner - baseline_period_per_scanner
         total_additional_per_scanner_all_periods += additional_per_scanner_period
         
@@ -110,8 +74,8 @@ def create_hourly_scan_table():
               f"{additional_per_scanner_period:+8.1f}")
     
     print("-" * 80)
-    baseline_total_per_scanner = sum(baseline_hourly_totals.values())/num_days/NUM_SCANNERS
-    rovis_total_per_scanner = sum(rovis_hourly_totals.values())/num_days/NUM_SCANNERS
+    baseline_total_per_scanner = baseline_hourly_totals.sum()/num_days/NUM_SCANNERS
+    rovis_total_per_scanner = rovis_hourly_totals.sum()/num_days/NUM_SCANNERS
     print(f"{'TOTAL':<20} {'24 hours':<12} {baseline_total_per_scanner:<12.1f} "
           f"{rovis_total_per_scanner:<12.1f} "
           f"{total_additional_per_scanner_all_periods:+8.1f}")
@@ -120,26 +84,19 @@ def create_hourly_scan_table():
     print(f"\nPEAK IMPACT HOURS (PER SCANNER)")
     print("-" * 60)
     
-    # Calculate additional scans per hour per scanner and find top 5
-    hourly_impact_per_scanner = []
-    for hour in range(24):
-        baseline_avg_per_scanner = (baseline_hourly_totals[hour] / num_days) / NUM_SCANNERS
-        rovis_avg_per_scanner = (rovis_hourly_totals[hour] / num_days) / NUM_SCANNERS
-        additional_per_scanner = rovis_avg_per_scanner - baseline_avg_per_scanner
-        hourly_impact_per_scanner.append((hour, additional_per_scanner))
-    
-    # Sort by additional scans per scanner (highest first)
-    top_hours = sorted(hourly_impact_per_scanner, key=lambda x: x[1], reverse=True)[:5]
+    # Top 5 hours by additional scans per scanner (highest first; ties keep hour order)
+    top_hours = np.argsort(-add_per_scanner, kind='stable')[:5]
     
     print(f"{'Rank':<6} {'Time':<8} {'Additional Scans Per Scanner':<30}")
     print("-" * 60)
     
-    for i, (hour, additional_per_scanner) in enumerate(top_hours, 1):
-        time_str = f"{hour:02d}:00"
-        print(f"{i:<6} {time_str:<8} {additional_per_scanner:+8.2f}")
+    print("\n".join(
+        f"{i:<6} {HOUR_LABELS[hour]:<8} {add_per_scanner[hour]:+8.2f}"
+        for i, hour in enumerate(top_hours, 1)
+    ))
     
     total_additional_per_scanner = cumulative_additional_per_scanner
-    baseline_total_per_scanner = sum(baseline_hourly_totals.values())/num_days/NUM_SCANNERS
+    baseline_total_per_scanner = baseline_hourly_totals.sum()/num_days/NUM_SCANNERS
     
     print(f"\nKEY INSIGHTS (PER SCANNER):")
     print(f"• Most additional capacity occurs during daytime hours (7am-7pm)")
@@ -149,4 +106,11 @@ def create_hourly_scan_table():
 
 
 if __name__ == "__main__":
-    create_hourly_scan_table()
\ No newline at end of file
+    if '--profile' in sys.argv:
+        # Profile the run and print the 20 most expensive calls (cumulative time) to stderr
+        import cProfile, pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(create_hourly_scan_table)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(20)
+    else:
+        create_hourly_scan_table()
\ No newline at end of file
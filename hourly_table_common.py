@@ -0,0 +1,47 @@
+import zlib
+import numpy as np
+
+# =============================================================================
+# SHARED SETUP FOR THE HOURLY TABLES
+# =============================================================================
+# hourly_scan_table.py and hourly_scan_table_corrected.py label and count the
+# hours of the day the same way; both import these from here.
+
+# Import the arrival model (no simpy needed just to count arrivals).
+# It sits next to the table scripts, which Python already puts on sys.path.
+from ct_scan_arrivals import generate_patient_arrivals, NUM_SCANNERS
+
+# Period type for each hour of the day (index = hour) and its icon
+PERIOD_NAMES = ['Overnight'] * 7 + ['Daytime'] * 12 + ['Evening'] * 4 + ['Overnight']
+PERIOD_ICONS = {'Daytime': '🌅', 'Evening': '🌆', 'Overnight': '🌙'}
+# Row labels for the hourly table: "HH:00" time slot and "<icon> <period>"
+HOUR_LABELS = [f"{hour:02d}:00" for hour in range(24)]
+PERIOD_LABELS = [f"{PERIOD_ICONS[period]} {period}" for period in PERIOD_NAMES]
+
+SEED = 42
+
+
+def hourly_counts_for_day(day):
+    """
+    Arrivals per hour of the day for one simulated day: row 0 is baseline,
+    row 1 is with robots. Arrivals after midnight fall outside the day and
+    are dropped. Each (scenario, day) draws from its own NumPy random stream,
+    so a day does not depend on which days were generated before it.
+    """
+    counts = np.zeros((2, 24), dtype=np.int64)
+    for row, scenario in enumerate(('baseline', 'rovis_only')):
+        arrivals = generate_patient_arrivals(scenario, seed=[SEED, day, zlib.crc32(scenario.encode())])
+        hours = (arrivals // 60).astype(np.int32)
+        counts[row] = np.bincount(hours[hours < 24], minlength=24)
+    return counts
+
+
+def hourly_arrival_totals(num_days):
+    """
+    Arrivals per hour of the day summed over num_days simulated days.
+    Returns (baseline_hourly_totals, rovis_hourly_totals), two length-24 arrays.
+    """
+    # Count each day and add up the per-day counts
+    daily_counts = [hourly_counts_for_day(day) for day in range(num_days)]
+    baseline_hourly_totals, rovis_hourly_totals = np.sum(daily_counts, axis=0)
+    return baseline_hourly_totals, rovis_hourly_totals
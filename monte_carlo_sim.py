@@ -1,76 +1,142 @@
-import random
+import os
+import sys
+
+import matplotlib
+
+# Set HEADLESS=1 for batch runs: skip the GUI and save the histogram to PNG instead
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
-import statistics
-import math
 import numpy as np
 
-def estimate_labor_savings(num_runs=1000, max_manual_hours=100, turnover_cost_mean=9000, turnover_cost_std=3000, turnover_rate_range=(0.05, 0.3)):
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy combine_labor_savings below is used without it
+    njit = None
+
+def combine_labor_savings(hourly_wage, task_time_manual, automation_frac, error_rate_manual, error_rate_auto,
+                          machine_downtime, material_waste_manual, material_waste_auto, training_hours,
+                          energy_savings, turnover_cost_per_transporter, turnover_rate):
+    """
+    Combine the drawn assumptions (one array entry per trial) into labor savings per trial.
+    """
+    turnover_savings = turnover_cost_per_transporter * (1 - turnover_rate)  # Savings from reducing turnover
+
+    # Compute labor savings considering these assumptions
+    manual_cost = hourly_wage * task_time_manual
+    automated_cost = manual_cost * (1 - automation_frac)
+    error_savings = (error_rate_manual - error_rate_auto) * 1000  # Scaled to impact
+    downtime_penalty = machine_downtime * 500  # Downtime has a financial penalty
+    waste_savings = (material_waste_manual - material_waste_auto) * 10  # Savings from reduced waste
+
+    # Calculate total estimated labor savings including turnover savings
+    return (
+        (manual_cost - automated_cost) + error_savings - downtime_penalty + 
+        waste_savings - training_hours * 10 + energy_savings * 1000 + turnover_savings
+    )
+
+if njit is not None:
+    # The same formula compiled for one trial at a time, so the kernel below
+    # reuses combine_labor_savings instead of repeating it
+    _combine_labor_savings_jit = njit(fastmath=True, cache=True)(combine_labor_savings)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mc_kernel(out, hourly_wage, task_time_manual, automation_frac, error_rate_manual, error_rate_auto,
+                   machine_downtime, material_waste_manual, material_waste_auto, training_hours,
+                   energy_savings, turnover_cost_per_transporter, turnover_rate):
+        # Trials are independent, so spread them across cores with prange
+        for i in prange(out.shape[0]):
+            out[i] = _combine_labor_savings_jit(
+                hourly_wage[i], task_time_manual[i], automation_frac[i], error_rate_manual[i], error_rate_auto[i],
+                machine_downtime[i], material_waste_manual[i], material_waste_auto[i], training_hours[i],
+                energy_savings[i], turnover_cost_per_transporter[i], turnover_rate[i],
+            )
+
+    def combine_labor_savings_parallel(*assumptions):
+        # Numba-compiled replacement for combine_labor_savings (same inputs and output)
+        out = np.empty(assumptions[0].shape[0])
+        _mc_kernel(out, *assumptions)
+        return out
+else:
+    combine_labor_savings_parallel = combine_labor_savings
+
+def estimate_labor_savings(num_runs=1000, max_manual_hours=100, turnover_cost_mean=9000, turnover_cost_std=3000, turnover_rate_range=(0.05, 0.3), seed=None):
     """
     Simulates labor savings over multiple trials by incorporating 
     10 different operational and cost assumptions, including turnover costs using a normal distribution.
 
+    All trials are drawn and evaluated at once: each assumption is an array
+    with one value per trial.
+
     Args:
         num_runs (int): Number of Monte Carlo simulations to run.
         max_manual_hours (int): Maximum hours required for manual work.
         turnover_cost_mean (float): Mean turnover cost per transporter.
         turnover_cost_std (float): Standard deviation of turnover cost per transporter.
         turnover_rate_range (tuple): Min and max transporter turnover rate.
+        seed (int, optional): Seed for the random number generator (None = fresh entropy).
 
     Returns:
-        list: A list of labor savings (in dollars) for each trial.
+        np.ndarray: Labor savings (in dollars) for each trial.
     """
-    savings_results = []
-
-    for _ in range(num_runs):
-        # Define 10 independent cost/operational assumptions with uncertainty
-
-        hourly_wage = random.uniform(15, 30)  # Wage per hour ($15 - $30)
-        task_time_manual = random.uniform(5, 15)  # Task time in hours (5-15)
-        error_rate_manual = random.uniform(0.02, 0.1)  # Error rate (2%-10%)
-        error_rate_auto = random.uniform(0.005, 0.03)  # Automated error rate (0.5%-3%)
-        machine_downtime = random.uniform(0.01, 0.2)  # Probability of machine failure (1%-20%)
-        maintenance_cost = random.uniform(500, 2000)  # Maintenance cost per year
-        material_waste_manual = random.uniform(5, 15)  # Waste % in manual process
-        material_waste_auto = random.uniform(1, 5)  # Waste % in automated process
-        training_hours = random.uniform(10, 40)  # Training required for automation (10-40 hrs)
-        energy_savings = random.uniform(0.1, 0.5)  # Energy reduction (10%-50%)
-        
-        # New: Transporter turnover costs using normal distribution
-        turnover_cost_per_transporter = np.random.normal(turnover_cost_mean, turnover_cost_std)
-        # Ensure turnover cost stays within realistic bounds
-        turnover_cost_per_transporter = max(2000, min(16000, turnover_cost_per_transporter))
-        turnover_rate = random.uniform(*turnover_rate_range)  # Turnover rate (5%-30%)
-        turnover_savings = turnover_cost_per_transporter * (1 - turnover_rate)  # Savings from reducing turnover
-
-        # Compute labor savings considering these assumptions
-        manual_cost = hourly_wage * task_time_manual
-        automated_cost = manual_cost * (1 - random.uniform(0.3, 0.8))  # Automation savings 30%-80%
-        error_savings = (error_rate_manual - error_rate_auto) * 1000  # Scaled to impact
-        downtime_penalty = machine_downtime * 500  # Downtime has a financial penalty
-        waste_savings = (material_waste_manual - material_waste_auto) * 10  # Savings from reduced waste
-
-        # Calculate total estimated labor savings including turnover savings
-        labor_saved = (
-            (manual_cost - automated_cost) + error_savings - downtime_penalty + 
-            waste_savings - training_hours * 10 + energy_savings * 1000 + turnover_savings
-        )
-        savings_results.append(labor_saved)
-
-    return savings_results
+    rng = np.random.default_rng(seed)
+
+    # Define 10 independent cost/operational assumptions with uncertainty,
+    # plus turnover rate and automation savings, as (low, high) uniform bounds
+    uniform_bounds = np.array([
+        (15, 30),               # hourly_wage: Wage per hour ($15 - $30)
+        (5, 15),                # task_time_manual: Task time in hours (5-15)
+        (0.02, 0.1),            # error_rate_manual: Error rate (2%-10%)
+        (0.005, 0.03),          # error_rate_auto: Automated error rate (0.5%-3%)
+        (0.01, 0.2),            # machine_downtime: Probability of machine failure (1%-20%)
+        (500, 2000),            # maintenance_cost: Maintenance cost per year
+        (5, 15),                # material_waste_manual: Waste % in manual process
+        (1, 5),                 # material_waste_auto: Waste % in automated process
+        (10, 40),               # training_hours: Training required for automation (10-40 hrs)
+        (0.1, 0.5),             # energy_savings: Energy reduction (10%-50%)
+        turnover_rate_range,    # turnover_rate: Turnover rate (5%-30%)
+        (0.3, 0.8),             # automation_frac: Automation savings 30%-80%
+    ], dtype=float)
+    # One draw for every assumption and trial; each row is one assumption
+    (hourly_wage, task_time_manual, error_rate_manual, error_rate_auto, machine_downtime,
+     maintenance_cost, material_waste_manual, material_waste_auto, training_hours,
+     energy_savings, turnover_rate, automation_frac) = rng.uniform(
+        uniform_bounds[:, :1], uniform_bounds[:, 1:], (len(uniform_bounds), num_runs)
+    )
+
+    # New: Transporter turnover costs using normal distribution
+    turnover_cost_per_transporter = rng.normal(turnover_cost_mean, turnover_cost_std, num_runs)
+    # Ensure turnover cost stays within realistic bounds
+    turnover_cost_per_transporter = np.clip(turnover_cost_per_transporter, 2000, 16000)
+
+    return combine_labor_savings_parallel(
+        hourly_wage, task_time_manual, automation_frac, error_rate_manual, error_rate_auto,
+        machine_downtime, material_waste_manual, material_waste_auto, training_hours,
+        energy_savings, turnover_cost_per_transporter, turnover_rate,
+    )
 
 if __name__ == "__main__":
     # Number of Monte Carlo simulations
     simulations = 1000
 
     # Run the Monte Carlo simulation for labor savings with turnover costs modeled as a normal distribution
-    labor_savings = estimate_labor_savings(num_runs=simulations)
+    if '--profile' in sys.argv:
+        # Profile the simulation and print the 20 most expensive calls (cumulative time) to stderr
+        import cProfile, pstats
+        profiler = cProfile.Profile()
+        labor_savings = profiler.runcall(estimate_labor_savings, num_runs=simulations)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(20)
+    else:
+        labor_savings = estimate_labor_savings(num_runs=simulations)
 
     # Calculate statistics
-    mean_savings = statistics.mean(labor_savings)
-    stdev_savings = statistics.pstdev(labor_savings)
+    mean_savings = labor_savings.mean()
+    stdev_savings = labor_savings.std()  # population std (ddof=0)
 
     # 95% Confidence Interval for labor savings
-    ci_margin = 1.96 * (stdev_savings / math.sqrt(simulations))
+    ci_margin = 1.96 * (stdev_savings / np.sqrt(simulations))
     ci_lower = mean_savings - ci_margin
     ci_upper = mean_savings + ci_margin
 
@@ -81,10 +147,14 @@ if __name__ == "__main__":
 
     # Create a histogram of labor savings
     plt.figure(figsize=(8, 5))
-    plt.hist(labor_savings, bins=25, edgecolor="black", color="skyblue", density=True)
+    counts, edges = np.histogram(labor_savings, bins=25, density=True)
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align="edge", edgecolor="black", color="skyblue")
     plt.title("Monte Carlo Simulation: Distribution of Labor Savings (Including Turnover)")
     plt.xlabel("Labor Savings ($)")
     plt.ylabel("Probability Density")
     plt.grid(axis="y", linestyle="--", alpha=0.7)
     plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    if HEADLESS:
+        plt.savefig("labor_savings.png", dpi=100)
+    else:
+        plt.show()
\ No newline at end of file
@@ -1,3 +1,7 @@
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
 import numpy as np
 
 # Cash flows
@@ -11,34 +15,49 @@ cash_flows = [
 # Discount rate
 discount_rate = 0.10
 
-def calculate_simple_payback_period(cash_flows):
-    cumulative_cash_flow = 0
-    for month, cash_flow in enumerate(cash_flows):
-        cumulative_cash_flow += cash_flow
-        if cumulative_cash_flow >= 0:
-            return round(month + (cumulative_cash_flow - cash_flow) / cash_flow, 2)
-    return None
-
-def calculate_discounted_payback_period(cash_flows, discount_rate):
-    cumulative_cash_flow = 0
-    for month, cash_flow in enumerate(cash_flows):
-        discounted_cash_flow = cash_flow / (1 + discount_rate) ** (month / 12)
-        cumulative_cash_flow += discounted_cash_flow
-        if cumulative_cash_flow >= 0:
-            return round(month + (cumulative_cash_flow - discounted_cash_flow) / discounted_cash_flow, 2)
-    return None
-
-def calculate_npv(cash_flows, discount_rate, years):
-    npv = 0
-    for month, cash_flow in enumerate(cash_flows[:years * 12 + 1]):
-        npv += cash_flow / (1 + discount_rate) ** (month / 12)
-    return round(npv, 2)
-
-simple_payback_period = calculate_simple_payback_period(cash_flows)
-discounted_payback_period = calculate_discounted_payback_period(cash_flows, discount_rate)
-one_year_npv = calculate_npv(cash_flows, discount_rate, 1)
-two_year_npv = calculate_npv(cash_flows, discount_rate, 2)
-three_year_npv = calculate_npv(cash_flows, discount_rate, 3)
+@dataclass
+class PaybackMetrics:
+    simple_payback_period: Optional[float]      # months, None if never paid back
+    discounted_payback_period: Optional[float]  # months, None if never paid back
+    cumulative_discounted: np.ndarray           # running NPV after each month
+
+    def npv(self, years):
+        # NPV over the first `years` years (months 0..years*12), or over every
+        # month when the cash flows end sooner
+        month = min(years * 12, len(self.cumulative_discounted) - 1)
+        return round(float(self.cumulative_discounted[month]), 2)
+
+def _payback_month(cumulative, flows):
+    # First month the running total turns non-negative, interpolated within that
+    # month; None if it never does. The totals dip again after each re-investment,
+    # but their running maximum is sorted, so the first crossing is a binary search.
+    month = int(np.searchsorted(np.maximum.accumulate(cumulative), 0.0))
+    if month == len(cumulative):
+        return None
+    return round(float(month + (cumulative[month] - flows[month]) / flows[month]), 2)
+
+def analyze(cash_flows, discount_rate):
+    # One pass over the monthly cash flows: discount every month at once and
+    # keep running totals for the payback periods and NPVs
+    cf = np.asarray(cash_flows, dtype=float)
+    months = np.arange(len(cf))
+    dcf = cf / (1 + discount_rate) ** (months / 12)
+    cum_disc = np.cumsum(dcf)
+    return PaybackMetrics(_payback_month(np.cumsum(cf), cf), _payback_month(cum_disc, dcf), cum_disc)
+
+if '--profile' in sys.argv:
+    # Profile the analysis and print the 20 most expensive calls (cumulative time) to stderr
+    import cProfile, pstats
+    profiler = cProfile.Profile()
+    metrics = profiler.runcall(analyze, cash_flows, discount_rate)
+    pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(20)
+else:
+    metrics = analyze(cash_flows, discount_rate)
+simple_payback_period = metrics.simple_payback_period
+discounted_payback_period = metrics.discounted_payback_period
+one_year_npv = metrics.npv(1)
+two_year_npv = metrics.npv(2)
+three_year_npv = metrics.npv(3)
 
 print(f"Simple Payback Period: {simple_payback_period} months")
 print(f"Discounted Payback Period: {discounted_payback_period} months")
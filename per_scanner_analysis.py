@@ -1,57 +1,107 @@
-import math
-import random
-import statistics
-import simpy
+import numpy as np
 
-# Import the functions from the main simulation
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy bin_hours below is used without it
+    njit = None
+
+# Import the arrival model (simpy-free) shared with the hourly tables
 import sys
 sys.path.append('.')
-from ct_scan_shands_des import (
-    generate_patient_arrivals, NUM_SCANNERS, NUM_ROBOTS, 
-    DAY_LENGTH_MIN, simulate_one_day
-)
+from ct_scan_arrivals import generate_patient_arrivals, NUM_SCANNERS, DAY_LENGTH_MIN
+
+# Daily completed scans (all scanners) from the main simulation results.
+# Shared by the utilization and financial reports so they quote the same run.
+SIM_BASELINE_SCANS_PER_DAY = 145.4
+SIM_ROVIS_SCANS_PER_DAY = 168.8
+
+# Period of each hour of the day (index = hour), as an index into PERIOD_NAMES
+PERIOD_IDX = np.array([2] * 7 + [0] * 12 + [1] * 4 + [2])  # 0-6 overnight, 7-18 daytime, 19-22 evening, 23 overnight
+PERIOD_NAMES = ('Daytime (7am-7pm)', 'Evening (7pm-11pm)', 'Overnight (11pm-7am)')
+PERIOD_SHORT_NAMES = ('Daytime', 'Evening', 'Overnight')
+
+# Fixed lines of the per-scanner report
+REPORT_TITLE = "PER-SCANNER ANALYSIS: WHERE DO ADDITIONAL SCANS OCCUR?"
+HOURLY_HEADER = f"{'Hour':<6} {'Period':<12} {'Baseline':<12} {'Rovis':<12} {'Additional':<12} {'% Increase':<12}"
+PERIOD_HEADER = f"{'Period':<20} {'Baseline':<12} {'Rovis':<12} {'Additional':<12} {'% of Daily Add\'l':<16}"
+RULE = "-" * 85
+# One hourly row: hour, period, baseline, rovis, additional, % increase
+ROW_FMT = "{:02d}:00 {:<12} {:<12.2f} {:<12.2f} {:+8.2f} {:9.1f}%"
+
+
+# Arrivals are generated within a single day (0 <= t < DAY_LENGTH_MIN), so
+# every arrival lands in hours 0-23 and bin_hours needs no range branch
+assert DAY_LENGTH_MIN <= 24 * 60
+
+if njit is not None:
+    @njit(cache=True)
+    def bin_hours(arrivals):
+        # Compiled hour bucketing: arrivals per hour of the day (length 24).
+        # Integer hour, capped at 23 with min() rather than a branch.
+        out = np.zeros(24, np.int64)
+        for i in range(arrivals.shape[0]):
+            out[min(np.int64(arrivals[i]) // 60, 23)] += 1
+        return out
+else:
+    def bin_hours(arrivals):
+        # Same counts as the compiled version, via np.bincount
+        hours = np.minimum(arrivals.astype(np.int64) // 60, 23)
+        return np.bincount(hours, minlength=24)
+
+
+def _arrivals_for_day(seed, day):
+    """
+    One day's (baseline, rovis) arrival arrays. Each scenario draws from its
+    own Generator seeded from (seed, day, scenario), so days can be generated
+    in any order or process without touching any global random state.
+    """
+    baseline_rng = np.random.default_rng([seed, day, 0])
+    rovis_rng = np.random.default_rng([seed, day, 1])
+    return generate_patient_arrivals('baseline', baseline_rng), generate_patient_arrivals('rovis_only', rovis_rng)
+
+
+def generate_arrival_days(num_days, seed=42):
+    """
+    Generate num_days of arrivals for both scenarios. Each day is seeded from
+    seed and its day number, so the result does not depend on generation
+    order.
+
+    Returns (baseline_days, rovis_days): tuples of per-day arrival arrays.
+    """
+    # A day is a few vectorized NumPy calls, far cheaper than starting a process pool
+    days = [_arrivals_for_day(seed, day) for day in range(num_days)]
+    baseline_days, rovis_days = zip(*days)
+    return baseline_days, rovis_days
+
 
 def analyze_per_scanner_patterns():
     """
     Analyze arrival patterns on a per-scanner basis to understand capacity distribution.
     """
-    print("PER-SCANNER ANALYSIS: WHERE DO ADDITIONAL SCANS OCCUR?")
-    print("=" * 80)
+    # Report lines, written out in one go at the end
+    lines = [REPORT_TITLE, "=" * 80]
     
-    # Set random seed for consistent results
-    random.seed(42)
-    
-    # Analyze arrival patterns across multiple days
-    baseline_hourly_totals = {hour: 0 for hour in range(24)}
-    rovis_hourly_totals = {hour: 0 for hour in range(24)}
+    # Analyze arrival patterns across multiple days (arrival counts per hour of day)
+    baseline_hourly_totals = np.zeros(24, dtype=np.int64)
+    rovis_hourly_totals = np.zeros(24, dtype=np.int64)
     
     num_days = 10  # Analyze 10 days for better patterns
     
-    baseline_daily_totals = []
-    rovis_daily_totals = []
+    baseline_daily_totals = np.empty(num_days, dtype=np.int64)
+    rovis_daily_totals = np.empty(num_days, dtype=np.int64)
     
-    for day in range(num_days):
-        # Generate arrivals for each scenario
-        baseline_arrivals = generate_patient_arrivals('baseline')
-        rovis_arrivals = generate_patient_arrivals('rovis_only')
-        
-        baseline_daily_totals.append(len(baseline_arrivals))
-        rovis_daily_totals.append(len(rovis_arrivals))
+    # Arrivals for each scenario (seeded for consistent results, generated once)
+    for day, (baseline_arrivals, rovis_arrivals) in enumerate(zip(*generate_arrival_days(num_days))):
+        baseline_daily_totals[day] = len(baseline_arrivals)
+        rovis_daily_totals[day] = len(rovis_arrivals)
         
         # Count by hour
-        for arrival in baseline_arrivals:
-            hour = int(arrival // 60)
-            if hour < 24:
-                baseline_hourly_totals[hour] += 1
-        
-        for arrival in rovis_arrivals:
-            hour = int(arrival // 60)
-            if hour < 24:
-                rovis_hourly_totals[hour] += 1
+        baseline_hourly_totals += bin_hours(baseline_arrivals)
+        rovis_hourly_totals += bin_hours(rovis_arrivals)
     
     # Calculate averages
-    baseline_avg_daily = statistics.mean(baseline_daily_totals)
-    rovis_avg_daily = statistics.mean(rovis_daily_totals)
+    baseline_avg_daily = baseline_daily_totals.mean()
+    rovis_avg_daily = rovis_daily_totals.mean()
     additional_daily = rovis_avg_daily - baseline_avg_daily
     
     # Convert to per-scanner basis
@@ -59,60 +109,49 @@ def analyze_per_scanner_patterns():
     rovis_per_scanner = rovis_avg_daily / NUM_SCANNERS
     additional_per_scanner = additional_daily / NUM_SCANNERS
     
-    print(f"SUMMARY ({num_days} days average - PER SCANNER):")
-    print(f"Baseline daily scans per scanner: {baseline_per_scanner:.1f}")
-    print(f"Rovis daily scans per scanner: {rovis_per_scanner:.1f}")
-    print(f"Additional daily scans per scanner: {additional_per_scanner:.1f}")
-    print(f"Percentage increase per scanner: {(additional_per_scanner/baseline_per_scanner)*100:.1f}%")
-    
-    print(f"\nHOURLY BREAKDOWN (per scanner averages):")
-    print(f"{'Hour':<6} {'Period':<12} {'Baseline':<12} {'Rovis':<12} {'Additional':<12} {'% Increase':<12}")
-    print("-" * 85)
-    
-    total_additional_per_scanner = 0
-    period_data = {
-        'Daytime (7am-7pm)': {'baseline': 0, 'rovis': 0, 'hours': list(range(7, 19))},
-        'Evening (7pm-11pm)': {'baseline': 0, 'rovis': 0, 'hours': list(range(19, 23))},
-        'Overnight (11pm-7am)': {'baseline': 0, 'rovis': 0, 'hours': list(range(0, 7)) + [23]}
-    }
+    lines.append(f"SUMMARY ({num_days} days average - PER SCANNER):")
+    lines.append(f"Baseline daily scans per scanner: {baseline_per_scanner:.1f}")
+    lines.append(f"Rovis daily scans per scanner: {rovis_per_scanner:.1f}")
+    lines.append(f"Additional daily scans per scanner: {additional_per_scanner:.1f}")
+    lines.append(f"Percentage increase per scanner: {(additional_per_scanner/baseline_per_scanner)*100:.1f}%")
+    
+    lines.append(f"\nHOURLY BREAKDOWN (per scanner averages):")
+    lines.append(HOURLY_HEADER)
+    lines.append(RULE)
+    
+    # Per-scanner averages, additional scans and % increase for every hour at once
+    inv_norm = 1.0 / (num_days * NUM_SCANNERS)  # hourly totals -> per day, per scanner
+    baseline_per_scanner_hr = baseline_hourly_totals * inv_norm
+    rovis_per_scanner_hr = rovis_hourly_totals * inv_norm
+    additional_per_scanner_hr = rovis_per_scanner_hr - baseline_per_scanner_hr
+    total_additional_per_scanner = additional_per_scanner_hr.sum()
+    # Hours with no baseline arrivals show 0% (ratio left at 1)
+    pct_increase = (np.divide(rovis_per_scanner_hr, baseline_per_scanner_hr,
+                              out=np.ones(24), where=baseline_per_scanner_hr > 0) - 1) * 100
+    
+    # Per-scanner totals for each period (indexed like PERIOD_NAMES)
+    period_baseline = np.bincount(PERIOD_IDX, weights=baseline_per_scanner_hr, minlength=len(PERIOD_NAMES))
+    period_rovis = np.bincount(PERIOD_IDX, weights=rovis_per_scanner_hr, minlength=len(PERIOD_NAMES))
     
     for hour in range(24):
-        if 7 <= hour < 19:
-            period = "Daytime"
-        elif 19 <= hour < 23:
-            period = "Evening"
-        else:
-            period = "Overnight"
-            
-        baseline_avg_per_scanner = (baseline_hourly_totals[hour] / num_days) / NUM_SCANNERS
-        rovis_avg_per_scanner = (rovis_hourly_totals[hour] / num_days) / NUM_SCANNERS
-        additional_per_scanner_hour = rovis_avg_per_scanner - baseline_avg_per_scanner
-        total_additional_per_scanner += additional_per_scanner_hour
-        
-        pct_increase = ((rovis_avg_per_scanner / baseline_avg_per_scanner - 1) * 100) if baseline_avg_per_scanner > 0 else 0
-        
-        # Add to period data
-        for period_name, data in period_data.items():
-            if hour in data['hours']:
-                data['baseline'] += baseline_avg_per_scanner
-                data['rovis'] += rovis_avg_per_scanner
-        
-        print(f"{hour:02d}:00 {period:<12} {baseline_avg_per_scanner:<12.2f} {rovis_avg_per_scanner:<12.2f} "
-              f"{additional_per_scanner_hour:+8.2f} {pct_increase:9.1f}%")
+        lines.append(ROW_FMT.format(hour, PERIOD_SHORT_NAMES[PERIOD_IDX[hour]], baseline_per_scanner_hr[hour],
+                                    rovis_per_scanner_hr[hour], additional_per_scanner_hr[hour], pct_increase[hour]))
     
-    print("-" * 85)
-    print(f"{'TOTAL':<19} {baseline_per_scanner:<12.1f} {rovis_per_scanner:<12.1f} {total_additional_per_scanner:+8.1f}")
+    lines.append(RULE)
+    lines.append(f"{'TOTAL':<19} {baseline_per_scanner:<12.1f} {rovis_per_scanner:<12.1f} {total_additional_per_scanner:+8.1f}")
     
-    print(f"\nPERIOD SUMMARIES (per scanner):")
-    print(f"{'Period':<20} {'Baseline':<12} {'Rovis':<12} {'Additional':<12} {'% of Daily Add\'l':<16}")
-    print("-" * 85)
+    lines.append(f"\nPERIOD SUMMARIES (per scanner):")
+    lines.append(PERIOD_HEADER)
+    lines.append(RULE)
     
-    for period_name, data in period_data.items():
-        additional_period = data['rovis'] - data['baseline']
-        pct_of_additional = (additional_period / total_additional_per_scanner * 100) if total_additional_per_scanner > 0 else 0
+    additional_period = period_rovis - period_baseline
+    for i, period_name in enumerate(PERIOD_NAMES):
+        pct_of_additional = (additional_period[i] / total_additional_per_scanner * 100) if total_additional_per_scanner > 0 else 0
         
-        print(f"{period_name:<20} {data['baseline']:<12.1f} {data['rovis']:<12.1f} "
-              f"{additional_period:+8.1f} {pct_of_additional:12.1f}%")
+        lines.append(f"{period_name:<20} {period_baseline[i]:<12.1f} {period_rovis[i]:<12.1f} "
+                     f"{additional_period[i]:+8.1f} {pct_of_additional:12.1f}%")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def analyze_scanner_utilization():
     """
@@ -133,8 +172,8 @@ def analyze_scanner_utilization():
     print(f"  Maximum scans/day/scanner: {max_scans_per_day_per_scanner:.0f}")
     
     # Calculate actual utilization
-    baseline_per_scanner = 145.4 / NUM_SCANNERS  # From simulation results
-    rovis_per_scanner = 168.8 / NUM_SCANNERS
+    baseline_per_scanner = SIM_BASELINE_SCANS_PER_DAY / NUM_SCANNERS  # From simulation results
+    rovis_per_scanner = SIM_ROVIS_SCANS_PER_DAY / NUM_SCANNERS
     
     baseline_utilization = (baseline_per_scanner / max_scans_per_day_per_scanner) * 100
     rovis_utilization = (rovis_per_scanner / max_scans_per_day_per_scanner) * 100
@@ -156,7 +195,7 @@ def analyze_financial_impact_per_scanner():
     # Constants
     cm_per_scan = 484
     days_per_month = 30
-    additional_scans_per_scanner_per_day = 3.9
+    additional_scans_per_scanner_per_day = round((SIM_ROVIS_SCANS_PER_DAY - SIM_BASELINE_SCANS_PER_DAY) / NUM_SCANNERS, 1)  # 3.9
     
     print(f"Additional scans per scanner per day: {additional_scans_per_scanner_per_day}")
     print(f"Contribution margin per scan: ${cm_per_scan}")